@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Entry point for PyInstaller build."""
+import multiprocessing
+
 from src.tui import main
 
 if __name__ == "__main__":
+    # Let frozen builds start strategy analysis worker processes
+    multiprocessing.freeze_support()
     main()
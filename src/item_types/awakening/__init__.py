@@ -26,6 +26,7 @@ from .engine import (
     SimulationConfig,
     SimulationResult,
     StepResult,
+    run_simulations,
 )
 
 
@@ -94,4 +95,5 @@ __all__ = [
     "SimulationConfig",
     "SimulationResult",
     "StepResult",
+    "run_simulations",
 ]
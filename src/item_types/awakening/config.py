@@ -102,8 +102,5 @@ OGIER_BLESSING_VARIANTS: dict[str, float] = {
     "saving": 0.10,    # +10% success
 }
 
-# Level display names
-ROMAN_NUMERALS = {
-    0: "0", 1: "I", 2: "II", 3: "III", 4: "IV",
-    5: "V", 6: "VI", 7: "VII", 8: "VIII", 9: "IX", 10: "X"
-}
+# Level display names, indexed by level
+ROMAN_NUMERALS = ("0", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X")
@@ -4,7 +4,7 @@ This module provides the simulation engine for awakening (armor/weapons) enhance
 """
 
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Optional
 
 from .config import (
@@ -27,7 +27,7 @@ from src.market_config import (
 )
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class MarketPrices:
     """Market prices for cost calculations."""
     crystal_price: int = 34_650_000           # Price per pristine black crystal
@@ -93,29 +93,31 @@ class StepResult:
     path_name: str = ""
 
 
-# Pre-compute rate caches at module level (computed once on import)
-_RATE_CACHE: dict[int, float] = {
-    level: AWAKENING_ENHANCEMENT_RATES.get(level, 0.01)
-    for level in range(1, 11)
-}
-_ANVIL_CACHE: dict[int, int] = {
-    level: ANVIL_THRESHOLDS_AWAKENING.get(level, 999)
-    for level in range(1, 11)
-}
+# Pre-compute rate and anvil tables at module level (computed once on import),
+# indexed by target level; index 0 is never a target and holds the defaults
+_RATE_CACHE: tuple[float, ...] = tuple(
+    AWAKENING_ENHANCEMENT_RATES.get(level, 0.01) for level in range(11)
+)
+_ANVIL_CACHE: tuple[int, ...] = tuple(
+    ANVIL_THRESHOLDS_AWAKENING.get(level, 999) for level in range(11)
+)
 
 # Pre-compute valks-adjusted rates at module level
-_RATE_CACHE_VALKS_10: dict[int, float] = {
-    level: min(1.0, rate * VALKS_MULTIPLIER_10)
-    for level, rate in _RATE_CACHE.items()
-}
-_RATE_CACHE_VALKS_50: dict[int, float] = {
-    level: min(1.0, rate * VALKS_MULTIPLIER_50)
-    for level, rate in _RATE_CACHE.items()
-}
-_RATE_CACHE_VALKS_100: dict[int, float] = {
-    level: min(1.0, rate * VALKS_MULTIPLIER_100)
-    for level, rate in _RATE_CACHE.items()
-}
+_RATE_CACHE_VALKS_10: tuple[float, ...] = tuple(
+    min(1.0, rate * VALKS_MULTIPLIER_10) for rate in _RATE_CACHE
+)
+_RATE_CACHE_VALKS_50: tuple[float, ...] = tuple(
+    min(1.0, rate * VALKS_MULTIPLIER_50) for rate in _RATE_CACHE
+)
+_RATE_CACHE_VALKS_100: tuple[float, ...] = tuple(
+    min(1.0, rate * VALKS_MULTIPLIER_100) for rate in _RATE_CACHE
+)
+
+# Hepta/Okta path constants, indexed by is_okta: (name, level the path starts from, sub-enhancements)
+_HEPTA_OKTA_PATHS = (
+    ("Hepta", 7, HEPTA_SUB_ENHANCEMENTS),
+    ("Okta", 8, OKTA_SUB_ENHANCEMENTS),
+)
 
 # Pre-extract recipe values (avoid dict lookups in hot path)
 _EXQUISITE_RESTORATION_SCROLLS = EXQUISITE_BLACK_CRYSTAL_RECIPE["restoration_scrolls"]
@@ -144,6 +146,7 @@ class AwakeningEngine:
         '_valks_10_from', '_valks_50_from', '_valks_100_from',
         '_crystal_price', '_valks_10_price', '_valks_50_price', '_valks_100_price',
         '_restoration_attempt_cost', '_exquisite_cost',
+        '_level_rates', '_level_costs', '_level_restores',
     )
 
     def __init__(self, config: SimulationConfig, seed: Optional[int] = None):
@@ -174,12 +177,39 @@ class AwakeningEngine:
             _EXQUISITE_PRISTINE_CRYSTAL * prices.crystal_price
         )
 
+        # Pre-compute per-level success rate and crystal + Valks cost for this
+        # config, indexed by target level (index 0 is unused)
+        self._level_rates, self._level_costs = self._build_level_tables()
+        # Whether a failure at each current level uses restoration (index 0 never does)
+        self._level_restores = tuple(
+            level > 0 and self._restoration_from > 0 and level >= self._restoration_from
+            for level in range(11)
+        )
+
+        self.anvil_energy: dict[int, int] = {}
         self.reset()
 
+    def _build_level_tables(self) -> tuple[tuple[float, ...], tuple[int, ...]]:
+        """Build the per-level (rates, costs) lookup tables used by run_fast()."""
+        rate_caches = {
+            "100": (_RATE_CACHE_VALKS_100, self._valks_100_price),
+            "50": (_RATE_CACHE_VALKS_50, self._valks_50_price),
+            "10": (_RATE_CACHE_VALKS_10, self._valks_10_price),
+            None: (_RATE_CACHE, 0),
+        }
+        rates = [0.0]
+        costs = [0]
+        for level in range(1, 11):
+            rate_cache, valks_price = rate_caches[self._get_valks_for_level(level)]
+            rates.append(rate_cache[level])
+            costs.append(self._crystal_price + valks_price)
+        return tuple(rates), tuple(costs)
+
     def reset(self) -> None:
         """Reset simulation state to initial values."""
         self.level = self.config.start_level
-        self.anvil_energy: dict[int, int] = {}
+        # Cleared in place so repeated resets (run_batch) don't allocate
+        self.anvil_energy.clear()
 
         # Resource tracking
         self.crystals = 0
@@ -197,6 +227,14 @@ class AwakeningEngine:
         self.hepta_pity = 0
         self.okta_pity = 0
 
+    def set_strategy(self, use_hepta: bool, use_okta: bool) -> None:
+        """Switch the Hepta/Okta strategy flags and reset, keeping the cached tables."""
+        if use_hepta != self._use_hepta or use_okta != self._use_okta:
+            self.config = replace(self.config, use_hepta=use_hepta, use_okta=use_okta)
+            self._use_hepta = use_hepta
+            self._use_okta = use_okta
+        self.reset()
+
     def is_complete(self) -> bool:
         """Check if target level has been reached."""
         return self.level >= self._target_level
@@ -262,12 +300,13 @@ class AwakeningEngine:
 
     def _perform_hepta_okta_step(self, is_okta: bool) -> StepResult:
         """Perform a Hepta/Okta sub-enhancement step."""
-        path_name = "Okta" if is_okta else "Hepta"
+        path_name, from_level, max_progress = _HEPTA_OKTA_PATHS[is_okta]
 
-        # Get current state
-        current_progress = self.okta_progress if is_okta else self.hepta_progress
-        current_pity = self.okta_pity if is_okta else self.hepta_pity
-        max_progress = OKTA_SUB_ENHANCEMENTS if is_okta else HEPTA_SUB_ENHANCEMENTS
+        # Load the path's (progress, pity) state once; it is stored back once below
+        if is_okta:
+            progress, pity = self.okta_progress, self.okta_pity
+        else:
+            progress, pity = self.hepta_progress, self.hepta_pity
 
         # Cost tracking (use cached values)
         self.exquisite_crystals += HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
@@ -275,61 +314,41 @@ class AwakeningEngine:
         self.attempts += 1
 
         # Check anvil pity
-        anvil_triggered = current_pity >= HEPTA_OKTA_ANVIL_PITY
-
-        if anvil_triggered or self.rng.random() < HEPTA_OKTA_SUCCESS_RATE:
-            # Success
-            if is_okta:
-                self.okta_progress += 1
-                self.okta_pity = 0
-            else:
-                self.hepta_progress += 1
-                self.hepta_pity = 0
-
-            new_progress = self.okta_progress if is_okta else self.hepta_progress
-
+        anvil_triggered = pity >= HEPTA_OKTA_ANVIL_PITY
+        success = anvil_triggered or self.rng.random() < HEPTA_OKTA_SUCCESS_RATE
+        path_complete = False
+
+        if success:
+            progress += 1
+            pity = 0
+            sub_progress = progress
             # Check if path complete
-            path_complete = new_progress >= max_progress
-            if path_complete:
-                target_level = 9 if is_okta else 8
-                self.level = target_level
-                self._reset_energy(target_level)
-                if is_okta:
-                    self.okta_progress = 0
-                    self.okta_pity = 0
-                else:
-                    self.hepta_progress = 0
-                    self.hepta_pity = 0
-
-            return StepResult(
-                success=True,
-                anvil_triggered=anvil_triggered,
-                starting_level=self.level if not path_complete else (8 if is_okta else 7),
-                ending_level=self.level,
-                is_hepta_okta=True,
-                sub_progress=new_progress if not path_complete else 0,
-                sub_pity=0,
-                path_complete=path_complete,
-                path_name=path_name,
-            )
+            if progress >= max_progress:
+                path_complete = True
+                self.level = from_level + 1
+                self._reset_energy(from_level + 1)
+                progress = sub_progress = 0
         else:
             # Failure - increment pity
-            if is_okta:
-                self.okta_pity += 1
-            else:
-                self.hepta_pity += 1
+            pity += 1
+            sub_progress = progress
 
-            return StepResult(
-                success=False,
-                anvil_triggered=False,
-                starting_level=self.level,
-                ending_level=self.level,
-                is_hepta_okta=True,
-                sub_progress=current_progress,
-                sub_pity=self.okta_pity if is_okta else self.hepta_pity,
-                path_complete=False,
-                path_name=path_name,
-            )
+        if is_okta:
+            self.okta_progress, self.okta_pity = progress, pity
+        else:
+            self.hepta_progress, self.hepta_pity = progress, pity
+
+        return StepResult(
+            success=success,
+            anvil_triggered=anvil_triggered,
+            starting_level=from_level if path_complete else self.level,
+            ending_level=self.level,
+            is_hepta_okta=True,
+            sub_progress=sub_progress,
+            sub_pity=pity,
+            path_complete=path_complete,
+            path_name=path_name,
+        )
 
     def _perform_enhancement_step(self) -> StepResult:
         """Perform a normal enhancement step."""
@@ -347,20 +366,20 @@ class AwakeningEngine:
 
         if valks_100_from > 0 and target_level >= valks_100_from:
             valks_type = "100"
-            base_rate = _RATE_CACHE_VALKS_100.get(target_level, 0.01)
+            base_rate = _RATE_CACHE_VALKS_100[target_level]
         elif valks_50_from > 0 and target_level >= valks_50_from:
             valks_type = "50"
-            base_rate = _RATE_CACHE_VALKS_50.get(target_level, 0.01)
+            base_rate = _RATE_CACHE_VALKS_50[target_level]
         elif valks_10_from > 0 and target_level >= valks_10_from:
             valks_type = "10"
-            base_rate = _RATE_CACHE_VALKS_10.get(target_level, 0.01)
+            base_rate = _RATE_CACHE_VALKS_10[target_level]
         else:
             valks_type = None
-            base_rate = _RATE_CACHE.get(target_level, 0.01)
+            base_rate = _RATE_CACHE[target_level]
 
         # Check anvil pity using cached lookup
         current_energy = anvil_energy.get(target_level, 0)
-        max_energy = _ANVIL_CACHE.get(target_level, 999)
+        max_energy = _ANVIL_CACHE[target_level]
         anvil_triggered = current_energy >= max_energy and max_energy > 0
 
         # Resource tracking (use cached prices)
@@ -396,8 +415,7 @@ class AwakeningEngine:
         restoration_success = False
         ending_level = level
 
-        restoration_from = self._restoration_from
-        if level > 0 and restoration_from > 0 and level >= restoration_from:
+        if self._level_restores[level]:
             restoration_attempted = True
             self.scrolls += RESTORATION_PER_ATTEMPT
             self.silver += self._restoration_attempt_cost
@@ -450,22 +468,18 @@ class AwakeningEngine:
         # Local variable caching for maximum performance
         level = self.level
         target_level = self._target_level
-        anvil_energy = self.anvil_energy
+        # Anvil energy as a list indexed by target level (index 0 unused)
+        anvil_energy = [self.anvil_energy.get(lvl, 0) for lvl in range(11)]
         rng_random = self.rng.random
 
         # Cached config values
-        restoration_from = self._restoration_from
         use_hepta = self._use_hepta
         use_okta = self._use_okta
-        valks_100_from = self._valks_100_from
-        valks_50_from = self._valks_50_from
-        valks_10_from = self._valks_10_from
-        crystal_price = self._crystal_price
-        valks_10_price = self._valks_10_price
-        valks_50_price = self._valks_50_price
-        valks_100_price = self._valks_100_price
+        level_rates = self._level_rates
+        level_costs = self._level_costs
+        level_restores = self._level_restores
         restoration_cost = self._restoration_attempt_cost
-        exquisite_cost = self._exquisite_cost
+        exquisite_attempt_cost = self._exquisite_cost * HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
 
         # Resource counters
         crystals = 0
@@ -480,65 +494,50 @@ class AwakeningEngine:
         okta_pity = 0
 
         while level < target_level:
-            # Check Hepta path
-            if ((use_hepta or hepta_progress > 0) and
-                level == 7 and hepta_progress < HEPTA_SUB_ENHANCEMENTS):
-                # Hepta step
-                exquisite_crystals += HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
-                silver += exquisite_cost * HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
-
-                if hepta_pity >= HEPTA_OKTA_ANVIL_PITY or rng_random() < HEPTA_OKTA_SUCCESS_RATE:
-                    hepta_progress += 1
-                    hepta_pity = 0
-                    if hepta_progress >= HEPTA_SUB_ENHANCEMENTS:
-                        level = 8
-                        anvil_energy[8] = 0
-                        hepta_progress = 0
-                else:
-                    hepta_pity += 1
+            # Hepta path; the level test comes first as it fails for most attempts
+            if (level == 7 and (use_hepta or hepta_progress > 0) and
+                hepta_progress < HEPTA_SUB_ENHANCEMENTS):
+                # Sub-attempts never lose progress, so run the path to completion here
+                while hepta_progress < HEPTA_SUB_ENHANCEMENTS:
+                    exquisite_crystals += HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
+                    silver += exquisite_attempt_cost
+                    if hepta_pity >= HEPTA_OKTA_ANVIL_PITY or rng_random() < HEPTA_OKTA_SUCCESS_RATE:
+                        hepta_progress += 1
+                        hepta_pity = 0
+                    else:
+                        hepta_pity += 1
+                level = 8
+                anvil_energy[8] = 0
+                hepta_progress = 0
                 continue
 
-            # Check Okta path
-            if ((use_okta or okta_progress > 0) and
-                level == 8 and okta_progress < OKTA_SUB_ENHANCEMENTS):
-                # Okta step
-                exquisite_crystals += HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
-                silver += exquisite_cost * HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
-
-                if okta_pity >= HEPTA_OKTA_ANVIL_PITY or rng_random() < HEPTA_OKTA_SUCCESS_RATE:
-                    okta_progress += 1
-                    okta_pity = 0
-                    if okta_progress >= OKTA_SUB_ENHANCEMENTS:
-                        level = 9
-                        anvil_energy[9] = 0
-                        okta_progress = 0
-                else:
-                    okta_pity += 1
+            # Okta path, likewise run to completion
+            if (level == 8 and (use_okta or okta_progress > 0) and
+                okta_progress < OKTA_SUB_ENHANCEMENTS):
+                while okta_progress < OKTA_SUB_ENHANCEMENTS:
+                    exquisite_crystals += HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
+                    silver += exquisite_attempt_cost
+                    if okta_pity >= HEPTA_OKTA_ANVIL_PITY or rng_random() < HEPTA_OKTA_SUCCESS_RATE:
+                        okta_progress += 1
+                        okta_pity = 0
+                    else:
+                        okta_pity += 1
+                level = 9
+                anvil_energy[9] = 0
+                okta_progress = 0
                 continue
 
             # Normal enhancement
             next_level = level + 1
 
-            # Get rate based on valks
-            if valks_100_from > 0 and next_level >= valks_100_from:
-                base_rate = _RATE_CACHE_VALKS_100.get(next_level, 0.01)
-                silver += valks_100_price
-            elif valks_50_from > 0 and next_level >= valks_50_from:
-                base_rate = _RATE_CACHE_VALKS_50.get(next_level, 0.01)
-                silver += valks_50_price
-            elif valks_10_from > 0 and next_level >= valks_10_from:
-                base_rate = _RATE_CACHE_VALKS_10.get(next_level, 0.01)
-                silver += valks_10_price
-            else:
-                base_rate = _RATE_CACHE.get(next_level, 0.01)
-
-            # Resource cost
+            # Rate and crystal + Valks cost from the per-level tables
+            base_rate = level_rates[next_level]
             crystals += 1
-            silver += crystal_price
+            silver += level_costs[next_level]
 
             # Check anvil pity
-            current_energy = anvil_energy.get(next_level, 0)
-            max_energy = _ANVIL_CACHE.get(next_level, 999)
+            current_energy = anvil_energy[next_level]
+            max_energy = _ANVIL_CACHE[next_level]
             anvil_triggered = current_energy >= max_energy and max_energy > 0
 
             if anvil_triggered or rng_random() < base_rate:
@@ -548,7 +547,7 @@ class AwakeningEngine:
             else:
                 # Failure
                 anvil_energy[next_level] = current_energy + 1
-                if level > 0 and restoration_from > 0 and level >= restoration_from:
+                if level_restores[level]:
                     scrolls += RESTORATION_PER_ATTEMPT
                     silver += restoration_cost
                     if rng_random() >= RESTORATION_SUCCESS_RATE:
@@ -558,6 +557,56 @@ class AwakeningEngine:
 
         return (crystals, scrolls, silver, exquisite_crystals)
 
+    def run_batch(self, n: int, seed: Optional[int] = None) -> list[tuple[int, int, int, int]]:
+        """Run n independent simulations with run_fast(), resetting after each.
+
+        With a seed, the RNG is reseeded with seed, seed + 1, ... before each
+        simulation, so every result depends only on its own seed.
+        Returns a list of (crystals, scrolls, silver, exquisite_crystals) tuples.
+        """
+        run_fast = self.run_fast
+        reset = self.reset
+        results = []
+        append = results.append
+        if seed is None:
+            for _ in range(n):
+                append(run_fast())
+                reset()
+        else:
+            reseed = self.rng.seed
+            for sim_seed in range(seed, seed + n):
+                reseed(sim_seed)
+                append(run_fast())
+                reset()
+        return results
+
+
+# Engine kept alive between run_simulations() calls within one (worker) process
+_shared_engine: Optional[AwakeningEngine] = None
+
+
+def run_simulations(
+    config: SimulationConfig, n: int, seed: Optional[int] = None, first: int = 0
+) -> list[tuple[int, int, int, int]]:
+    """Run n independent simulations for a config, numbered from first.
+
+    Module-level so it can be submitted to a process pool. The engine is reused
+    across calls; configs differing only in Hepta/Okta strategy switch it via
+    set_strategy() instead of building a new one. With a seed, simulation i runs
+    on seed + i, so its result only depends on (config, seed, i): a run split
+    into calls any way, on any workers, gives the same results.
+    Returns a list of (crystals, scrolls, silver, exquisite_crystals) tuples.
+    """
+    global _shared_engine
+    engine = _shared_engine
+    if engine is not None and engine.config == replace(
+        config, use_hepta=engine._use_hepta, use_okta=engine._use_okta
+    ):
+        engine.set_strategy(config.use_hepta, config.use_okta)
+    else:
+        engine = _shared_engine = AwakeningEngine(config)
+    return engine.run_batch(n, None if seed is None else seed + first)
+
 
 # Alias for backward compatibility
 EnhancementEngine = AwakeningEngine
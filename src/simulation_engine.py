@@ -11,6 +11,7 @@ from src.item_types.awakening.engine import (
     SimulationConfig,
     SimulationResult,
     StepResult,
+    run_simulations,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "SimulationConfig",
     "SimulationResult",
     "StepResult",
+    "run_simulations",
 ]
@@ -73,19 +73,20 @@ class SimulationResult:
     attempt_history: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GearState:
     """Tracks current state of gear being enhanced."""
     awakening_level: int = 0
-    anvil_energy: dict = field(default_factory=dict)
+    # Accumulated anvil energy, indexed by target level (0-10)
+    anvil_energy: list[int] = field(default_factory=lambda: [0] * 11)
 
     def get_energy(self, target_level: int) -> int:
         """Get accumulated anvil energy for a target level."""
-        return self.anvil_energy.get(target_level, 0)
+        return self.anvil_energy[target_level]
 
     def add_energy(self, target_level: int) -> None:
         """Add 1 energy for a target level."""
-        self.anvil_energy[target_level] = self.get_energy(target_level) + 1
+        self.anvil_energy[target_level] += 1
 
     def reset_energy(self, target_level: int) -> None:
         """Reset energy for a target level (on success)."""
@@ -95,7 +96,7 @@ class GearState:
         """Create a copy of the gear state."""
         return GearState(
             awakening_level=self.awakening_level,
-            anvil_energy=dict(self.anvil_energy),
+            anvil_energy=self.anvil_energy.copy(),
         )
 
 
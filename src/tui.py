@@ -1,14 +1,23 @@
 """TUI for BDM Enhancement Simulator using Textual."""
 import asyncio
+import multiprocessing
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr
 from dataclasses import dataclass, field
-from operator import itemgetter
-from typing import Optional
+from functools import partial
+from operator import attrgetter, itemgetter
+from typing import Callable, NamedTuple, Optional
 
+from rich.highlighter import ReprHighlighter
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.events import Click
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Checkbox,
@@ -34,6 +43,8 @@ from .simulator import (
 from .config import (
     AWAKENING_ENHANCEMENT_RATES,
     ANVIL_THRESHOLDS_AWAKENING,
+    HEPTA_OKTA_SUCCESS_RATE,
+    RESTORATION_SUCCESS_RATE,
     VALKS_MULTIPLIER_10,
     VALKS_MULTIPLIER_50,
     VALKS_MULTIPLIER_100,
@@ -48,20 +59,175 @@ from .market_config import (
     EXQUISITE_BLACK_CRYSTAL_RECIPE,
 )
 from .simulation_engine import (
-    EnhancementEngine,
     SimulationConfig as EngineConfig,
     MarketPrices,
+    run_simulations,
 )
 from .utils import format_silver, format_time
 
 
-ROMAN_NUMERALS = {
-    0: "0", 1: "I", 2: "II", 3: "III", 4: "IV",
-    5: "V", 6: "VI", 7: "VII", 8: "VIII", 9: "IX", 10: "X"
+# Level display names, indexed by level
+ROMAN_NUMERALS = ("0", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X")
+
+# Base success rate and anvil threshold by target level (index 0 is never a target)
+_BASE_RATES = tuple(AWAKENING_ENHANCEMENT_RATES.get(level, 0.01) for level in range(11))
+_ANVIL_THRESHOLDS = tuple(ANVIL_THRESHOLDS_AWAKENING.get(level, 999) for level in range(11))
+# "/cap" tails of the anvil pity labels, so a refresh only formats the energy
+_ANVIL_SUFFIXES = tuple(f"/{cap}" for cap in _ANVIL_THRESHOLDS)
+
+# Animation speed options; the value doubles as an index into _DELAYS
+_SPEED_OPTIONS = (
+    ("Fast", 0),      # Minimal delay, animated
+    ("Instant", -1),  # Precalculate all at once
+    ("Regular", 1),   # ~1 second per enhancement (in-game speed)
+)
+# Per-attempt delay for animated speeds. Fast only yields to the event loop
+# (sleep(0) skips the timer heap); the stats refresh is already throttled
+# separately, so the UI stays responsive. Regular is ~1s per attempt.
+_DELAYS = (0, 1.0)
+
+# Strategy analysis workers are spawned (not forked) so they behave the same
+# on every platform and never inherit the running UI's threads
+_SPAWN_CONTEXT = multiprocessing.get_context("spawn")
+
+# How often pending caption/stats changes are drawn (60 fps)
+_STATS_REFRESH_INTERVAL = 1 / 60
+
+# Strategy table redraws arriving within this window are coalesced into one
+_TABLE_REDRAW_INTERVAL = 0.05
+
+# Simulations per strategy analysis pool job. Fixed, so how a run is split into jobs
+# never depends on the machine; the pool's worker count only sets how many run at once
+_JOB_SIZE = 25
+
+# Victory animation playback rate and how long the glow is held before the stats
+_VICTORY_FRAME_INTERVAL = 1 / 20
+_VICTORY_HOLD_SECONDS = 1.5
+
+# Extract (success, anvil_triggered) from normal and Hepta/Okta attempt results
+_ATTEMPT_OUTCOME = attrgetter("success", "anvil_triggered")
+
+# Materials consumed by a normal attempt, keyed by (valks type, restoration attempted).
+# Shared between results instead of building a dict per attempt; treat as read-only.
+_ATTEMPT_MATERIALS = {
+    (valks, restoration): {
+        "pristine_black_crystal": 1,
+        **({f"valks_advice_{valks}": 1} if valks else {}),
+        **({"restoration_scroll": RESTORATION_PER_ATTEMPT} if restoration else {}),
+    }
+    for valks in (None, "10", "50", "100")
+    for restoration in (False, True)
 }
 
+# Attempt log lines are assembled from prebuilt Text fragments. Each fragment is
+# parsed and highlighted here the way the log would treat a markup string, so
+# writing a line skips the per-line markup parse and highlighter regexes.
+_LOG_HIGHLIGHTER = ReprHighlighter()
+
+
+def _log_text(markup: str) -> Text:
+    """Parse and highlight log markup as RichLog(markup=True, highlight=True) does."""
+    return _LOG_HIGHLIGHTER(Text.from_markup(markup))
+
+
+# Fragments indexed by level (or pity / sub-progress / Valks type)
+_LOG_LEVEL_HEADER = tuple(
+    _log_text(f"[bold]{ROMAN_NUMERALS[level]}[/bold] → [bold]{ROMAN_NUMERALS[level + 1]}[/bold]: ")
+    for level in range(10)
+)
+_LOG_SUCCESS = _log_text("[green]SUCCESS[/green]")
+_LOG_ANVIL_SUCCESS = _log_text("[yellow bold]ANVIL SUCCESS![/yellow bold]")
+_LOG_FAIL = _log_text("[red]FAIL[/red]")
+_LOG_VALKS_NOTE = {valks: _log_text(f" [cyan](Valks +{valks}%)[/cyan]") for valks in ("10", "50", "100")}
+_LOG_RESTORATION_SAVED = _log_text(" [blue]| Restoration: SAVED[/blue]")
+_LOG_RESTORATION_FAILED = _log_text(" [red]| Restoration: FAILED[/red]")
+_LOG_DROP_NOTE = tuple(_log_text(f" [red bold]↓ {numeral}[/red bold]") for numeral in ROMAN_NUMERALS)
+_LOG_NOW_AT_NOTE = tuple(_log_text(f" [green bold]↑ Now at +{numeral}[/green bold]") for numeral in ROMAN_NUMERALS)
+# Hepta/Okta sub-attempt header by is_okta, then sub-progress
+_LOG_SUB_HEADER = {
+    is_okta: tuple(
+        _log_text(f"[cyan]{'Okta' if is_okta else 'Hepta'}[/cyan] ({progress}/{max_subs}): ")
+        for progress in range(max_subs + 1)
+    )
+    for is_okta, max_subs in ((False, HEPTA_SUB_ENHANCEMENTS), (True, OKTA_SUB_ENHANCEMENTS))
+}
+_LOG_SUB_SUCCESS = _log_text("[green]SUB SUCCESS[/green]")
+_LOG_SUB_FAIL = tuple(
+    _log_text(f"[red]FAIL[/red] (pity: {pity}/{HEPTA_OKTA_ANVIL_PITY})") for pity in range(HEPTA_OKTA_ANVIL_PITY + 1)
+)
+_LOG_INSTANT_HEADER = _log_text("[bold]Enhancement simulation complete![/bold]\n")
+_LOG_LINE_BREAK = Text("\n")
+
+# Hepta/Okta strategies compared by the strategy screen, as (use_hepta, use_okta, label),
+# with their (use_hepta, use_okta) keys in display order and a key -> label lookup
+_HEPTA_OKTA_STRATEGIES = (
+    (True, True, "Hepta+Okta"),
+    (True, False, "Hepta only"),
+    (False, True, "Okta only"),
+    (False, False, "Normal"),
+)
+_HEPTA_OKTA_STRATEGY_KEYS = tuple((use_hepta, use_okta) for use_hepta, use_okta, _ in _HEPTA_OKTA_STRATEGIES)
+_HEPTA_OKTA_STRATEGY_LABELS = {
+    (use_hepta, use_okta): label for use_hepta, use_okta, label in _HEPTA_OKTA_STRATEGIES
+}
+# Restoration strategy row labels ("+VI"), indexed by the restoration start level
+_RESTORATION_LABELS = tuple(f"+{numeral}" for numeral in ROMAN_NUMERALS)
+
+# Options for the target/start level and starting Hepta/Okta progress selects
+_TARGET_LEVEL_OPTIONS = tuple((f"+{ROMAN_NUMERALS[i]} ({i})", i) for i in range(1, 11))
+_START_LEVEL_OPTIONS = tuple((f"+{ROMAN_NUMERALS[i]} ({i})", i) for i in range(0, 10))
+_START_HEPTA_OPTIONS = tuple((f"{i}/5", i) for i in range(0, 5))
+_START_OKTA_OPTIONS = tuple((f"{i}/10", i) for i in range(0, 10))
+
+# Options for the "use from level" selects (Valks and restoration share the same list)
+_LEVEL_FROM_OPTIONS = (("Never", 0),) + tuple((f"+{ROMAN_NUMERALS[i]}", i) for i in range(1, 11))
+
+
+def _build_rates_table() -> str:
+    """Build the rates table string."""
+    lines = ["Level   Rate    Anvil Pity"]
+    lines.append("-" * 28)
+    for level in range(1, 11):
+        rate = AWAKENING_ENHANCEMENT_RATES.get(level, 0) * 100
+        anvil = ANVIL_THRESHOLDS_AWAKENING.get(level, 0)
+        anvil_str = str(anvil) if anvil > 0 else "-"
+        lines.append(f"  {ROMAN_NUMERALS[level]:<6} {rate:>5.1f}%  {anvil_str:>6}")
+    return "\n".join(lines)
+
+
+# Rates reference shown on the config screen; built from constants only
+_RATES_TABLE = _build_rates_table()
+
+
+def _analysis_pool() -> ProcessPoolExecutor:
+    """Create the worker process pool for strategy analysis.
+
+    Textual swaps sys.stderr for a capture object without a file descriptor,
+    which multiprocessing's resource tracker would try to hand to its helper
+    process, so the real stream is restored while the pool starts it.
+    """
+    with redirect_stderr(sys.__stderr__):
+        return ProcessPoolExecutor(mp_context=_SPAWN_CONTEXT)
+
+
+def _submit_strategy_jobs(
+    loop: asyncio.AbstractEventLoop, pool: ProcessPoolExecutor, engine_config: EngineConfig,
+    num_sims: int, seed: int,
+) -> list[asyncio.Future]:
+    """Submit one strategy's simulations to the pool in jobs of _JOB_SIZE.
 
-@dataclass
+    Simulation i runs on seed + i (see run_simulations), so the results do not
+    depend on how many workers the pool has or which of them runs each job.
+    """
+    return [
+        loop.run_in_executor(
+            pool, run_simulations, engine_config, min(_JOB_SIZE, num_sims - done), seed, done,
+        )
+        for done in range(0, num_sims, _JOB_SIZE)
+    ]
+
+
+@dataclass(slots=True)
 class SimConfig:
     """Configuration for a simulation run."""
     target_level: int = 9
@@ -72,10 +238,34 @@ class SimConfig:
     valks_50_from: int = 3      # Use +50% Valks starting from this level (0 = never)
     valks_100_from: int = 5     # Use +100% Valks starting from this level (0 = never)
     restoration_from: int = 6   # Use restoration from this level (0 = never)
-    speed: float = 0.0          # -1 = instant, 0 = fast (default), 1 = regular (in-game)
+    speed: int = 0              # -1 = instant, 0 = fast (default), 1 = regular (in-game)
     market_prices: MarketPrices = field(default_factory=MarketPrices)
     use_hepta: bool = False     # Use Hepta path for VII→VIII (5 sub-enhancements)
     use_okta: bool = False      # Use Okta path for VIII→IX (10 sub-enhancements)
+    seed: Optional[int] = None  # Strategy analysis seed for reproducible runs (None = random)
+
+
+# Position of silver in StrategyResult rows; the table formats it with a K/M/B/T suffix
+_SILVER_INDEX = 2
+
+
+@dataclass(slots=True)
+class StrategyResult:
+    """Summary rows of one analysed strategy, as (crystals, scrolls, silver[, exquisite]) tuples."""
+    p50: tuple
+    p90: tuple
+    worst: tuple
+    label: str
+    progress: int
+
+
+class SubAttemptResult(NamedTuple):
+    """Result of a single Hepta/Okta sub-enhancement attempt."""
+    success: bool
+    anvil_triggered: bool
+    sub_progress: int
+    sub_pity: int
+    completed: bool  # This success finished the path
 
 
 class ConfigScreen(Screen):
@@ -177,8 +367,8 @@ class ConfigScreen(Screen):
 
         with ScrollableContainer(id="config-container"):
             yield Static("BDM Awakening Enhancement Simulator", id="title")
-            with Collapsible(title="Enhancement Rates & Anvil Pity", collapsed=True):
-                yield Static(self._build_rates_table(), id="rates-table")
+            # Contents are mounted on first expand (see on_collapsible_expanded)
+            yield Collapsible(title="Enhancement Rates & Anvil Pity", collapsed=True, id="rates-collapsible")
             yield Rule()
 
             # Target and Starting level
@@ -186,7 +376,7 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row"):
                 yield Label("Target Level:", classes="config-label")
                 yield Select(
-                    [(f"+{ROMAN_NUMERALS[i]} ({i})", i) for i in range(1, 11)],
+                    _TARGET_LEVEL_OPTIONS,
                     value=9,
                     id="target-level",
                     classes="config-select",
@@ -194,7 +384,7 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row"):
                 yield Label("Start Level:", classes="config-label")
                 yield Select(
-                    [(f"+{ROMAN_NUMERALS[i]} ({i})", i) for i in range(0, 10)],
+                    _START_LEVEL_OPTIONS,
                     value=0,
                     id="start-level",
                     classes="config-select",
@@ -202,7 +392,7 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row", id="start-hepta-row"):
                 yield Label("Start Hepta Progress:", classes="config-label")
                 yield Select(
-                    [(f"{i}/5", i) for i in range(0, 5)],
+                    _START_HEPTA_OPTIONS,
                     value=0,
                     id="start-hepta",
                     classes="config-select",
@@ -210,7 +400,7 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row", id="start-okta-row"):
                 yield Label("Start Okta Progress:", classes="config-label")
                 yield Select(
-                    [(f"{i}/10", i) for i in range(0, 10)],
+                    _START_OKTA_OPTIONS,
                     value=0,
                     id="start-okta",
                     classes="config-select",
@@ -235,7 +425,7 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row"):
                 yield Label("+10% Valks from level:", classes="config-label")
                 yield Select(
-                    [("Never", 0)] + [(f"+{ROMAN_NUMERALS[i]}", i) for i in range(1, 11)],
+                    _LEVEL_FROM_OPTIONS,
                     value=1,
                     id="valks-10",
                     classes="config-select",
@@ -244,7 +434,7 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row"):
                 yield Label("+50% Valks from level:", classes="config-label")
                 yield Select(
-                    [("Never", 0)] + [(f"+{ROMAN_NUMERALS[i]}", i) for i in range(1, 11)],
+                    _LEVEL_FROM_OPTIONS,
                     value=3,
                     id="valks-50",
                     classes="config-select",
@@ -253,7 +443,7 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row"):
                 yield Label("+100% Valks from level:", classes="config-label")
                 yield Select(
-                    [("Never", 0)] + [(f"+{ROMAN_NUMERALS[i]}", i) for i in range(1, 11)],
+                    _LEVEL_FROM_OPTIONS,
                     value=5,
                     id="valks-100",
                     classes="config-select",
@@ -266,7 +456,7 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row"):
                 yield Label("Use restoration from level:", classes="config-label")
                 yield Select(
-                    [("Never", 0)] + [(f"+{ROMAN_NUMERALS[i]}", i) for i in range(1, 11)],
+                    _LEVEL_FROM_OPTIONS,
                     value=6,
                     id="restoration-from",
                     classes="config-select",
@@ -279,12 +469,8 @@ class ConfigScreen(Screen):
             with Horizontal(classes="config-row"):
                 yield Label("Animation speed:", classes="config-label")
                 yield Select(
-                    [
-                        ("Fast", 0.0),      # Minimal delay, animated
-                        ("Instant", -1.0),  # Precalculate all at once
-                        ("Regular", 1.0),   # ~1 second per enhancement (in-game speed)
-                    ],
-                    value=0.0,
+                    _SPEED_OPTIONS,
+                    value=0,
                     id="speed",
                     classes="config-select",
                 )
@@ -306,6 +492,15 @@ class ConfigScreen(Screen):
                     classes="config-input-small",
                     type="integer",
                 )
+            with Horizontal(classes="config-row"):
+                yield Label("Seed (optional):", classes="config-label")
+                yield Input(
+                    value="",
+                    placeholder="random",
+                    id="analysis-seed",
+                    classes="config-input-small",
+                    type="integer",
+                )
             with Horizontal(classes="strategy-buttons"):
                 yield Button("Restoration Strategy", id="restoration-strategy-button", variant="primary")
                 yield Button("Hepta/Okta Strategy", id="hepta-okta-strategy-button", variant="primary")
@@ -313,16 +508,30 @@ class ConfigScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Hide Hepta/Okta starting rows initially."""
-        self.query_one("#start-hepta-row").add_class("hidden")
-        self.query_one("#start-okta-row").add_class("hidden")
+        """Cache the form widgets and hide Hepta/Okta starting rows initially."""
+        # Form widgets by id, read whenever a simulation or analysis is started
+        self._selects = {select.id: select for select in self.query(Select)}
+        self._checkboxes = {checkbox.id: checkbox for checkbox in self.query(Checkbox)}
+        self._inputs = {input_widget.id: input_widget for input_widget in self.query(Input)}
+        self._start_hepta_row = self.query_one("#start-hepta-row")
+        self._start_okta_row = self.query_one("#start-okta-row")
+        self._start_hepta_row.add_class("hidden")
+        self._start_okta_row.add_class("hidden")
+
+    def on_collapsible_expanded(self, event: Collapsible.Expanded) -> None:
+        """Mount the rates table the first time its section is expanded."""
+        collapsible = event.collapsible
+        if collapsible.id == "rates-collapsible" and not collapsible.query("#rates-table"):
+            collapsible.query_one(Collapsible.Contents).mount(
+                Static(_RATES_TABLE, id="rates-table")
+            )
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle start level changes to show/hide Hepta/Okta rows."""
         if event.select.id == "start-level":
             start_level = event.value
-            hepta_row = self.query_one("#start-hepta-row")
-            okta_row = self.query_one("#start-okta-row")
+            hepta_row = self._start_hepta_row
+            okta_row = self._start_okta_row
 
             # Show Hepta row only if start level is VII (7)
             if start_level == 7:
@@ -330,7 +539,7 @@ class ConfigScreen(Screen):
             else:
                 hepta_row.add_class("hidden")
                 # Reset Hepta progress if not at level VII
-                self.query_one("#start-hepta", Select).value = 0
+                self._selects["start-hepta"].value = 0
 
             # Show Okta row only if start level is VIII (8)
             if start_level == 8:
@@ -338,18 +547,7 @@ class ConfigScreen(Screen):
             else:
                 okta_row.add_class("hidden")
                 # Reset Okta progress if not at level VIII
-                self.query_one("#start-okta", Select).value = 0
-
-    def _build_rates_table(self) -> str:
-        """Build the rates table string."""
-        lines = ["Level   Rate    Anvil Pity"]
-        lines.append("-" * 28)
-        for level in range(1, 11):
-            rate = AWAKENING_ENHANCEMENT_RATES.get(level, 0) * 100
-            anvil = ANVIL_THRESHOLDS_AWAKENING.get(level, 0)
-            anvil_str = str(anvil) if anvil > 0 else "-"
-            lines.append(f"  {ROMAN_NUMERALS[level]:<6} {rate:>5.1f}%  {anvil_str:>6}")
-        return "\n".join(lines)
+                self._selects["start-okta"].value = 0
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "start-button":
@@ -366,33 +564,9 @@ class ConfigScreen(Screen):
         """Get price from app-level market prices."""
         return self.app.market_prices.get(price_key, 0)
 
-    def _parse_input(self, input_id: str, default: int = 0) -> int:
-        """Parse integer from input field, returning default on error."""
-        try:
-            input_field = self.query_one(f"#{input_id}", Input)
-            value = input_field.value.strip()
-            if not value:
-                return default
-            return int(value)
-        except (ValueError, Exception):
-            return default
-
-    def _start_simulation(self) -> None:
-        # Collect config values
-        target_select = self.query_one("#target-level", Select)
-        start_level_select = self.query_one("#start-level", Select)
-        start_hepta_select = self.query_one("#start-hepta", Select)
-        start_okta_select = self.query_one("#start-okta", Select)
-        valks_10_select = self.query_one("#valks-10", Select)
-        valks_50_select = self.query_one("#valks-50", Select)
-        valks_100_select = self.query_one("#valks-100", Select)
-        restoration_select = self.query_one("#restoration-from", Select)
-        speed_select = self.query_one("#speed", Select)
-        use_hepta_checkbox = self.query_one("#use-hepta", Checkbox)
-        use_okta_checkbox = self.query_one("#use-okta", Checkbox)
-
-        # Collect market prices
-        market_prices = MarketPrices(
+    def _market_prices(self) -> MarketPrices:
+        """Build the market prices for a run from the app-level prices."""
+        return MarketPrices(
             crystal_price=self._get_price("crystal"),
             restoration_bundle_price=self._get_price("restoration"),
             valks_10_price=self._get_price("valks_10"),
@@ -400,102 +574,62 @@ class ConfigScreen(Screen):
             valks_100_price=self._get_price("valks_100"),
         )
 
-        self.config = SimConfig(
-            target_level=target_select.value,
-            start_level=start_level_select.value,
-            start_hepta=start_hepta_select.value,
-            start_okta=start_okta_select.value,
-            valks_10_from=valks_10_select.value,
-            valks_50_from=valks_50_select.value,
-            valks_100_from=valks_100_select.value,
-            restoration_from=restoration_select.value,
-            speed=speed_select.value,
-            market_prices=market_prices,
-            use_hepta=use_hepta_checkbox.value,
-            use_okta=use_okta_checkbox.value,
+    def _parse_input(self, input_id: str, default: Optional[int] = 0) -> Optional[int]:
+        """Parse integer from input field, returning default if empty or invalid."""
+        value = self._inputs[input_id].value.strip()
+        return int(value) if value.removeprefix("-").isdecimal() else default
+
+    def _collect_config(self, **overrides) -> SimConfig:
+        """Build a SimConfig from the form; keyword arguments override individual fields."""
+        selects = self._selects
+        checkboxes = self._checkboxes
+        fields = dict(
+            target_level=selects["target-level"].value,
+            start_level=selects["start-level"].value,
+            start_hepta=selects["start-hepta"].value,
+            start_okta=selects["start-okta"].value,
+            valks_10_from=selects["valks-10"].value,
+            valks_50_from=selects["valks-50"].value,
+            valks_100_from=selects["valks-100"].value,
+            restoration_from=selects["restoration-from"].value,
+            speed=selects["speed"].value,
+            market_prices=self._market_prices(),
+            use_hepta=checkboxes["use-hepta"].value,
+            use_okta=checkboxes["use-okta"].value,
+            seed=self._parse_input("analysis-seed", None),  # Empty = random
         )
+        fields.update(overrides)
+        return SimConfig(**fields)
+
+    def _num_simulations(self) -> int:
+        """Number of simulations per strategy from the form (minimum 100)."""
+        return max(self._parse_input("num-simulations", 1000), 100)
 
+    def _start_simulation(self) -> None:
+        self.config = self._collect_config()
         self.app.push_screen(SimulationScreen(self.config))
 
     def _start_restoration_strategy_analysis(self) -> None:
         """Start restoration level strategy analysis (normal enhancement, varying restoration levels)."""
-        target_select = self.query_one("#target-level", Select)
-        start_level_select = self.query_one("#start-level", Select)
-        valks_10_select = self.query_one("#valks-10", Select)
-        valks_50_select = self.query_one("#valks-50", Select)
-        valks_100_select = self.query_one("#valks-100", Select)
-
-        # Get number of simulations
-        num_sims = self._parse_input("num-simulations", 1000)
-        if num_sims < 100:
-            num_sims = 100  # Minimum 100 simulations
-
-        # Collect market prices
-        market_prices = MarketPrices(
-            crystal_price=self._get_price("crystal"),
-            restoration_bundle_price=self._get_price("restoration"),
-            valks_10_price=self._get_price("valks_10"),
-            valks_50_price=self._get_price("valks_50"),
-            valks_100_price=self._get_price("valks_100"),
-        )
-
-        self.config = SimConfig(
-            target_level=target_select.value,
-            start_level=start_level_select.value,
+        self.config = self._collect_config(
             start_hepta=0,  # Not used for normal enhancement
             start_okta=0,
-            valks_10_from=valks_10_select.value,
-            valks_50_from=valks_50_select.value,
-            valks_100_from=valks_100_select.value,
             restoration_from=0,  # Will be varied in strategy screen
-            speed=0.0,
-            market_prices=market_prices,
+            speed=0,
             use_hepta=False,  # Normal enhancement only
             use_okta=False,
         )
-
-        self.app.push_screen(RestorationStrategyScreen(self.config, num_sims))
+        self.app.push_screen(RestorationStrategyScreen(self.config, self._num_simulations()))
 
     def _start_hepta_okta_strategy_analysis(self) -> None:
         """Start Hepta/Okta strategy analysis (with +VI restoration fixed)."""
-        target_select = self.query_one("#target-level", Select)
-        start_level_select = self.query_one("#start-level", Select)
-        start_hepta_select = self.query_one("#start-hepta", Select)
-        start_okta_select = self.query_one("#start-okta", Select)
-        valks_10_select = self.query_one("#valks-10", Select)
-        valks_50_select = self.query_one("#valks-50", Select)
-        valks_100_select = self.query_one("#valks-100", Select)
-
-        # Get number of simulations
-        num_sims = self._parse_input("num-simulations", 1000)
-        if num_sims < 100:
-            num_sims = 100  # Minimum 100 simulations
-
-        # Collect market prices
-        market_prices = MarketPrices(
-            crystal_price=self._get_price("crystal"),
-            restoration_bundle_price=self._get_price("restoration"),
-            valks_10_price=self._get_price("valks_10"),
-            valks_50_price=self._get_price("valks_50"),
-            valks_100_price=self._get_price("valks_100"),
-        )
-
-        self.config = SimConfig(
-            target_level=target_select.value,
-            start_level=start_level_select.value,
-            start_hepta=start_hepta_select.value,
-            start_okta=start_okta_select.value,
-            valks_10_from=valks_10_select.value,
-            valks_50_from=valks_50_select.value,
-            valks_100_from=valks_100_select.value,
+        self.config = self._collect_config(
             restoration_from=6,  # Fixed at +VI
-            speed=0.0,
-            market_prices=market_prices,
+            speed=0,
             use_hepta=False,  # Will be varied in strategy screen
             use_okta=False,
         )
-
-        self.app.push_screen(HeptaOktaStrategyScreen(self.config, num_sims))
+        self.app.push_screen(HeptaOktaStrategyScreen(self.config, self._num_simulations()))
 
     def action_quit(self) -> None:
         self.app.exit()
@@ -612,6 +746,35 @@ class SimulationScreen(Screen):
         super().__init__()
         self.config = config
         self.simulator = AwakeningSimulator()
+        # Bind the RNG draw once; it is called on every roll
+        self._random = self.simulator.rng.random
+        # Prices are fixed for the screen's lifetime; resolve them once for the attempt paths
+        prices = config.market_prices
+        self._crystal_price = prices.crystal_price
+        self._valks_10_price = prices.valks_10_price
+        self._valks_50_price = prices.valks_50_price
+        self._valks_100_price = prices.valks_100_price
+        self._restoration_attempt_cost = prices.restoration_attempt_cost
+        self._exquisite_cost = self._compute_exquisite_crystal_cost(prices)
+        self._exquisite_attempt_cost = self._exquisite_cost * HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
+        # Whether a failure at each level (0-10) uses restoration; fixed by restoration_from
+        self._restores_at = tuple(
+            level > 0 and self._should_use_restoration(level) for level in range(11)
+        )
+        # Per target level (1-10; index 0 unused): Valks type, Valks-boosted success rate
+        # and crystal + Valks silver cost; fixed by the valks_*_from settings
+        self._valks_at = tuple(self._get_valks_for_level(level) for level in range(11))
+        valks_multipliers = {
+            None: 1.0, "10": VALKS_MULTIPLIER_10, "50": VALKS_MULTIPLIER_50, "100": VALKS_MULTIPLIER_100,
+        }
+        valks_prices = {
+            None: 0, "10": self._valks_10_price, "50": self._valks_50_price, "100": self._valks_100_price,
+        }
+        self._rates_at = tuple(
+            min(1.0, _BASE_RATES[level] * valks_multipliers[valks]) if valks else _BASE_RATES[level]
+            for level, valks in enumerate(self._valks_at)
+        )
+        self._attempt_silver_at = tuple(self._crystal_price + valks_prices[valks] for valks in self._valks_at)
         # Initialize gear state from config starting values
         self.gear = GearState(awakening_level=config.start_level)
         self.running = False
@@ -633,7 +796,17 @@ class SimulationScreen(Screen):
         self.hepta_sub_pity = 0      # Current pity for active Hepta sub-enhancement
         self.okta_sub_pity = 0       # Current pity for active Okta sub-enhancement
         # Snapshot of anvil energy for display after reaching target
-        self.final_anvil_snapshot: dict[int, int] | None = None
+        self.final_anvil_snapshot: list[int] | None = None
+        # Pending victory animation/hold timer (Regular mode only)
+        self._celebration_timer: Timer | None = None
+        # Set when the caption/stats panels need redrawing (see _flush_stats)
+        self._stats_dirty = False
+        # Text last drawn into each caption/stats widget, so unchanged ones are skipped
+        self._shown_text: dict[Static, str] = {}
+        # Instant-mode attempts computing on a worker thread, if any, and whether
+        # a restart is waiting for it to finish
+        self._instant_job: asyncio.Future | None = None
+        self._restart_queued = False
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -702,12 +875,27 @@ class SimulationScreen(Screen):
 
     async def on_mount(self) -> None:
         """Start the simulation when screen is mounted."""
+        # Cache the widgets updated during the run instead of querying per attempt
+        self._current_display = self.query_one("#current-display", Static)
+        self._max_display = self.query_one("#max-display", Static)
+        self._attempts_display = self.query_one("#attempts-display", Static)
+        self._anvil_displays = tuple(
+            self.query_one(f"#anvil-{level}", Static) for level in range(5, 11)
+        )
+        self._hepta_display = self.query_one("#hepta-progress", Static)
+        self._okta_display = self.query_one("#okta-progress", Static)
+        self._stat_displays = {
+            name: self.query_one(f"#stat-{name}", Static)
+            for name in ("crystals", "exquisite", "scrolls", "valks-10", "valks-50", "valks-100", "silver", "time")
+        }
+        # Stats changes are coalesced and drawn at most once per frame
+        self.set_interval(_STATS_REFRESH_INTERVAL, self._flush_stats)
         self.run_simulation()
 
     def run_simulation(self) -> None:
-        """Start the simulation as a background task."""
+        """Start the simulation as a screen worker, replacing any previous run."""
         self.running = True
-        asyncio.create_task(self._run_simulation_async())
+        self.run_worker(self._run_simulation_async, name="sim", group="sim", exclusive=True)
 
     async def _run_simulation_async(self) -> None:
         """Run the simulation with animated output."""
@@ -716,35 +904,28 @@ class SimulationScreen(Screen):
         if self.config.speed < 0:
             # Instant mode: precalculate everything, then output
             log.write("[bold]Calculating...[/bold]")
-            await asyncio.sleep(0.001)  # Allow UI to update
-
-            results = []  # List of (type, data) tuples
-            while self.gear.awakening_level < self.config.target_level and self.running:
-                # Check if we should use Hepta/Okta paths
-                if self._should_use_hepta():
-                    result = self._perform_hepta_okta_attempt(is_okta=False)
-                    results.append(("hepta", result))
-                    if self._check_hepta_okta_complete():
-                        results.append(("level_up", {"from": 7, "to": 8, "path": "Hepta"}))
-                elif self._should_use_okta():
-                    result = self._perform_hepta_okta_attempt(is_okta=True)
-                    results.append(("okta", result))
-                    if self._check_hepta_okta_complete():
-                        results.append(("level_up", {"from": 8, "to": 9, "path": "Okta"}))
-                else:
-                    result = self._perform_enhancement()
-                    results.append(("normal", result))
-
-            # Now output all results at once
-            log.clear()
-            log.write("[bold]Enhancement simulation complete![/bold]\n")
+            # Attempts are computed on a worker thread so the UI keeps drawing meanwhile
+            self._instant_job = asyncio.get_running_loop().run_in_executor(None, self._precompute_all_results)
+            try:
+                results = await self._instant_job
+            finally:
+                self._instant_job = None
+            if not self.running:
+                return
+
+            # Now output all results at once, as a single log write
+            lines = [_LOG_INSTANT_HEADER]
+            append = lines.append
             for result_type, result in results:
                 if result_type == "normal":
-                    self._log_attempt(log, result)
+                    append(self._format_attempt(result))
                 elif result_type in ("hepta", "okta"):
-                    self._log_hepta_okta_attempt(log, result, result_type == "okta")
+                    append(self._format_hepta_okta_attempt(result, result_type == "okta"))
                 elif result_type == "level_up":
-                    self._log_hepta_okta_complete(log, result)
+                    append(self._format_hepta_okta_complete(result))
+            log.clear()
+            log.write(_LOG_LINE_BREAK.join(lines))
+            self._track_max_level()
 
             self._update_stats()
 
@@ -753,46 +934,99 @@ class SimulationScreen(Screen):
         else:
             # Animated mode
             log.write("[bold]Starting enhancement simulation...[/bold]\n")
-
-            while self.gear.awakening_level < self.config.target_level and self.running:
+            # Border flashes are only visible at Regular speed; skip the await otherwise
+            flash = self._is_regular_mode()
+            delay = _DELAYS[self.config.speed]
+
+            target_level = self.config.target_level
+            # The attempt path only changes with the level, so pick it on level change
+            phase_level = -1
+            while self.gear.awakening_level < target_level and self.running:
                 # Wait while paused
                 while self.paused and self.running:
                     await asyncio.sleep(0.05)
                 if not self.running:
                     break
-                # Check if we should use Hepta/Okta paths
-                if self._should_use_hepta():
-                    result = self._perform_hepta_okta_attempt(is_okta=False)
-                    await self._flash_attempt(result["success"], result["anvil_triggered"])
-                    self._log_hepta_okta_attempt(log, result, is_okta=False)
-                    self._update_stats()
-                    if self._check_hepta_okta_complete():
-                        self._log_hepta_okta_complete(log, {"from": 7, "to": 8, "path": "Hepta"})
-                        self._update_stats()
-                elif self._should_use_okta():
-                    result = self._perform_hepta_okta_attempt(is_okta=True)
-                    await self._flash_attempt(result["success"], result["anvil_triggered"])
-                    self._log_hepta_okta_attempt(log, result, is_okta=True)
-                    self._update_stats()
-                    if self._check_hepta_okta_complete():
-                        self._log_hepta_okta_complete(log, {"from": 8, "to": 9, "path": "Okta"})
-                        self._update_stats()
-                else:
-                    result = self._perform_enhancement()
-                    await self._flash_attempt(result.success, result.anvil_triggered)
-                    self._log_attempt(log, result)
-                    self._update_stats()
+                if self.gear.awakening_level != phase_level:
+                    phase_level = self.gear.awakening_level
+                    perform, emit, outcome = self._select_phase()
+
+                result = perform()
+                if flash:
+                    await self._flash_attempt(*outcome(result))
+                emit(log, result)
 
-                # Use minimum 0.0001s delay for "fast" mode (10x faster)
-                delay = max(0.0001, self.config.speed)
                 await asyncio.sleep(delay)
 
             if self.running:
-                await self._victory_celebration(log)
-                self._log_completion(log)
+                self._victory_celebration(log)
 
         self.running = False
 
+    def _precompute_all_results(self) -> list[tuple[str, object]]:
+        """Run attempts until the target (or a stop) and return them as (type, data) tuples.
+
+        Runs off the event loop in instant mode; it only touches simulation state.
+        """
+        results = []
+        append = results.append
+        # The worker owns the state until it returns (restart waits for it), so bind it once
+        gear = self.gear
+        target_level = self.config.target_level
+        # As in the animated loop, the attempt path only changes with the level
+        phase_level = -1
+        while gear.awakening_level < target_level and self.running:
+            if gear.awakening_level != phase_level:
+                phase_level = gear.awakening_level
+                if self._should_use_hepta():
+                    perform, result_type, path = self._perform_hepta_attempt, "hepta", "Hepta"
+                elif self._should_use_okta():
+                    perform, result_type, path = self._perform_okta_attempt, "okta", "Okta"
+                else:
+                    perform, result_type, path = self._perform_enhancement, "normal", None
+            result = perform()
+            append((result_type, result))
+            # Only a sub-attempt that finished its path can level up
+            if path is not None and result.completed and self._check_hepta_okta_complete():
+                append(("level_up", {"from": phase_level, "to": phase_level + 1, "path": path}))
+        return results
+
+    def _select_phase(self) -> tuple[Callable, Callable, Callable]:
+        """Pick the (perform, emit, outcome) functions for the current level.
+
+        Hepta/Okta progress is reset whenever the path completes, so the
+        choice only depends on the awakening level.
+        """
+        if self._should_use_hepta():
+            return (
+                self._perform_hepta_attempt,
+                partial(self._emit_hepta_okta_attempt, is_okta=False),
+                _ATTEMPT_OUTCOME,
+            )
+        if self._should_use_okta():
+            return (
+                self._perform_okta_attempt,
+                partial(self._emit_hepta_okta_attempt, is_okta=True),
+                _ATTEMPT_OUTCOME,
+            )
+        return self._perform_enhancement, self._emit_attempt, _ATTEMPT_OUTCOME
+
+    def _emit_attempt(self, log: RichLog, result: AttemptResult) -> None:
+        """Log a normal attempt and refresh the stats panel."""
+        self._log_attempt(log, result)
+        self._update_stats()
+
+    def _emit_hepta_okta_attempt(self, log: RichLog, result: SubAttemptResult, is_okta: bool) -> None:
+        """Log a Hepta/Okta attempt, applying the level-up if the path completed."""
+        self._log_hepta_okta_attempt(log, result, is_okta=is_okta)
+        self._update_stats()
+        if result.completed and self._check_hepta_okta_complete():
+            if is_okta:
+                self._log_hepta_okta_complete(log, {"from": 8, "to": 9, "path": "Okta"})
+            else:
+                self._log_hepta_okta_complete(log, {"from": 7, "to": 8, "path": "Hepta"})
+            self._update_stats()
+
     def _get_valks_for_level(self, target_level: int) -> Optional[str]:
         """Determine which Valks to use for a given target level."""
         # Priority: 100% > 50% > 10%
@@ -811,11 +1045,15 @@ class SimulationScreen(Screen):
         return current_level >= self.config.restoration_from
 
     def _get_exquisite_crystal_cost(self) -> int:
+        """Return the cost of one Exquisite Black Crystal in silver."""
+        return self._exquisite_cost
+
+    @staticmethod
+    def _compute_exquisite_crystal_cost(prices: MarketPrices) -> int:
         """Calculate the cost of one Exquisite Black Crystal in silver.
 
         Recipe: 1050 restoration scrolls + 2 valks 100% + 30 pristine crystals
         """
-        prices = self.config.market_prices
         scroll_cost = (EXQUISITE_BLACK_CRYSTAL_RECIPE["restoration_scrolls"] *
                        prices.restoration_bundle_price) // RESTORATION_MARKET_BUNDLE_SIZE
         valks_cost = EXQUISITE_BLACK_CRYSTAL_RECIPE["valks_100"] * prices.valks_100_price
@@ -846,79 +1084,71 @@ class SimulationScreen(Screen):
                 self.gear.awakening_level == 8 and
                 self.okta_sub_progress < OKTA_SUB_ENHANCEMENTS)
 
-    def _perform_hepta_okta_attempt(self, is_okta: bool) -> dict:
-        """Perform a single Hepta/Okta sub-enhancement attempt.
-
-        Returns dict with: success, anvil_triggered, sub_progress, sub_pity
-        """
-        prices = self.config.market_prices
-        crystals_per_attempt = HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
-        anvil_pity = HEPTA_OKTA_ANVIL_PITY
-
-        # Get current pity
-        current_pity = self.okta_sub_pity if is_okta else self.hepta_sub_pity
-
+    def _perform_hepta_attempt(self) -> SubAttemptResult:
+        """Perform a single Hepta sub-enhancement attempt (VII→VIII)."""
         # Cost tracking
-        self.total_exquisite_crystals += crystals_per_attempt
-        exquisite_cost = self._get_exquisite_crystal_cost() * crystals_per_attempt
-        self.total_silver += exquisite_cost
+        self.total_exquisite_crystals += HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
+        self.total_silver += self._exquisite_attempt_cost
         self.attempt_count += 1
-        # Only count attempts for final target (Hepta=VIII, Okta=IX)
-        target_for_path = 8 if not is_okta else 9
-        if target_for_path == self.config.target_level:
+        # Only count attempts for final target
+        if self.config.target_level == 8:
             self.target_attempts += 1
 
-        # Check anvil pity
-        anvil_triggered = current_pity >= anvil_pity
-
-        if anvil_triggered:
-            # Guaranteed success on this sub-enhancement
-            if is_okta:
-                self.okta_sub_progress += 1
-                self.okta_sub_pity = 0
-            else:
-                self.hepta_sub_progress += 1
-                self.hepta_sub_pity = 0
-
-            return {
-                "success": True,
-                "anvil_triggered": True,
-                "sub_progress": self.okta_sub_progress if is_okta else self.hepta_sub_progress,
-                "sub_pity": 0,
-            }
+        # Anvil pity guarantees success; otherwise roll the fixed 6% rate
+        anvil_triggered = self.hepta_sub_pity >= HEPTA_OKTA_ANVIL_PITY
+        if anvil_triggered or self._random() < HEPTA_OKTA_SUCCESS_RATE:
+            self.hepta_sub_progress += 1
+            self.hepta_sub_pity = 0
+            return SubAttemptResult(
+                success=True,
+                anvil_triggered=anvil_triggered,
+                sub_progress=self.hepta_sub_progress,
+                sub_pity=0,
+                completed=self.hepta_sub_progress >= HEPTA_SUB_ENHANCEMENTS,
+            )
 
-        # Roll for success
-        # Hepta/Okta sub-enhancement has fixed 6% success rate
-        base_rate = 0.06  # 6% per sub-enhancement attempt
+        # Failed - increment pity
+        self.hepta_sub_pity += 1
+        return SubAttemptResult(
+            success=False,
+            anvil_triggered=False,
+            sub_progress=self.hepta_sub_progress,
+            sub_pity=self.hepta_sub_pity,
+            completed=False,
+        )
 
-        if self.simulator.rng.random() < base_rate:
-            # Success on sub-enhancement
-            if is_okta:
-                self.okta_sub_progress += 1
-                self.okta_sub_pity = 0
-            else:
-                self.hepta_sub_progress += 1
-                self.hepta_sub_pity = 0
+    def _perform_okta_attempt(self) -> SubAttemptResult:
+        """Perform a single Okta sub-enhancement attempt (VIII→IX)."""
+        # Cost tracking
+        self.total_exquisite_crystals += HEPTA_OKTA_CRYSTALS_PER_ATTEMPT
+        self.total_silver += self._exquisite_attempt_cost
+        self.attempt_count += 1
+        # Only count attempts for final target
+        if self.config.target_level == 9:
+            self.target_attempts += 1
 
-            return {
-                "success": True,
-                "anvil_triggered": False,
-                "sub_progress": self.okta_sub_progress if is_okta else self.hepta_sub_progress,
-                "sub_pity": 0,
-            }
+        # Anvil pity guarantees success; otherwise roll the fixed 6% rate
+        anvil_triggered = self.okta_sub_pity >= HEPTA_OKTA_ANVIL_PITY
+        if anvil_triggered or self._random() < HEPTA_OKTA_SUCCESS_RATE:
+            self.okta_sub_progress += 1
+            self.okta_sub_pity = 0
+            return SubAttemptResult(
+                success=True,
+                anvil_triggered=anvil_triggered,
+                sub_progress=self.okta_sub_progress,
+                sub_pity=0,
+                completed=self.okta_sub_progress >= OKTA_SUB_ENHANCEMENTS,
+            )
 
         # Failed - increment pity
-        if is_okta:
-            self.okta_sub_pity += 1
-        else:
-            self.hepta_sub_pity += 1
-
-        return {
-            "success": False,
-            "anvil_triggered": False,
-            "sub_progress": self.okta_sub_progress if is_okta else self.hepta_sub_progress,
-            "sub_pity": self.okta_sub_pity if is_okta else self.hepta_sub_pity,
-        }
+        self.okta_sub_pity += 1
+        return SubAttemptResult(
+            success=False,
+            anvil_triggered=False,
+            sub_progress=self.okta_sub_progress,
+            sub_pity=self.okta_sub_pity,
+            completed=False,
+        )
 
     def _check_hepta_okta_complete(self) -> bool:
         """Check if Hepta/Okta is complete and level up if so.
@@ -949,110 +1179,86 @@ class SimulationScreen(Screen):
 
     def _perform_enhancement(self) -> AttemptResult:
         """Perform a single enhancement attempt."""
-        target_level = self.gear.awakening_level + 1
-        valks_type = self._get_valks_for_level(target_level)
-
-        # Get base rate
-        base_rate = AWAKENING_ENHANCEMENT_RATES.get(target_level, 0.01)
+        gear = self.gear
+        starting_level = gear.awakening_level
+        target_level = starting_level + 1
+        is_final_level = target_level == self.config.target_level
+        valks_type = self._valks_at[target_level]
 
-        # Apply Valks multiplier (relative bonus, not additive!)
+        # Base rate with the Valks multiplier already applied (relative bonus, not additive!)
         # Example: 0.5% with +100% Valks = 0.5% × 2.0 = 1%
-        if valks_type == "10":
-            base_rate = min(1.0, base_rate * VALKS_MULTIPLIER_10)
-        elif valks_type == "50":
-            base_rate = min(1.0, base_rate * VALKS_MULTIPLIER_50)
-        elif valks_type == "100":
-            base_rate = min(1.0, base_rate * VALKS_MULTIPLIER_100)
+        base_rate = self._rates_at[target_level]
 
         # Check anvil pity
-        current_energy = self.gear.get_energy(target_level)
-        max_energy = ANVIL_THRESHOLDS_AWAKENING.get(target_level, 999)
+        current_energy = gear.get_energy(target_level)
+        max_energy = _ANVIL_THRESHOLDS[target_level]
         anvil_triggered = current_energy >= max_energy and max_energy > 0
 
-        starting_level = self.gear.awakening_level
-        materials = {"pristine_black_crystal": 1}
-
         # Track resources using custom market prices from config
-        prices = self.config.market_prices
         self.attempt_count += 1
         # Only count attempts for final target level
-        if target_level == self.config.target_level:
+        if is_final_level:
             self.target_attempts += 1
         self.total_crystals += 1
-        self.total_silver += prices.crystal_price
+        self.total_silver += self._attempt_silver_at[target_level]
 
         # Track valks usage
         if valks_type:
-            materials[f"valks_advice_{valks_type}"] = 1
             if valks_type == "10":
                 self.total_valks_10 += 1
-                self.total_silver += prices.valks_10_price
             elif valks_type == "50":
                 self.total_valks_50 += 1
-                self.total_silver += prices.valks_50_price
-            elif valks_type == "100":
+            else:
                 self.total_valks_100 += 1
-                self.total_silver += prices.valks_100_price
 
         if anvil_triggered:
             # Guaranteed success
             # Save anvil snapshot before reaching final target
-            if target_level == self.config.target_level:
-                self.final_anvil_snapshot = dict(self.gear.anvil_energy)
-            self.gear.awakening_level = target_level
-            self.gear.reset_energy(target_level)
+            if is_final_level:
+                self.final_anvil_snapshot = gear.anvil_energy.copy()
+            gear.awakening_level = target_level
+            gear.reset_energy(target_level)
             return AttemptResult(
                 success=True,
                 starting_level=starting_level,
                 ending_level=target_level,
                 anvil_triggered=True,
                 valks_used=valks_type,
-                materials_cost=materials,
+                materials_cost=_ATTEMPT_MATERIALS[valks_type, False],
             )
 
         # Roll for success
-        success = self.simulator.rng.random() < base_rate
+        success = self._random() < base_rate
 
         if success:
             # Save anvil snapshot before reaching final target
-            if target_level == self.config.target_level:
-                self.final_anvil_snapshot = dict(self.gear.anvil_energy)
-            self.gear.awakening_level = target_level
-            self.gear.reset_energy(target_level)
+            if is_final_level:
+                self.final_anvil_snapshot = gear.anvil_energy.copy()
+            gear.awakening_level = target_level
+            gear.reset_energy(target_level)
             return AttemptResult(
                 success=True,
                 starting_level=starting_level,
                 ending_level=target_level,
                 valks_used=valks_type,
-                materials_cost=materials,
+                materials_cost=_ATTEMPT_MATERIALS[valks_type, False],
             )
 
         # Failed - accumulate energy
-        self.gear.add_energy(target_level)
+        gear.add_energy(target_level)
 
-        # Handle restoration
-        restoration_attempted = False
+        # Handle restoration; otherwise the level drops (except at 0)
+        restoration_attempted = self._restores_at[starting_level]
         restoration_success = False
-        ending_level = self.gear.awakening_level
-
-        if self.gear.awakening_level > 0:
-            use_restoration = self._should_use_restoration(self.gear.awakening_level)
-
-            if use_restoration:
-                restoration_attempted = True
-                self.total_scrolls += RESTORATION_PER_ATTEMPT
-                # Add silver cost for restoration attempt
-                # 200 scrolls per attempt, 200K scrolls = 1T → 200 scrolls = 1B
-                self.total_silver += prices.restoration_attempt_cost
-                materials["restoration_scroll"] = RESTORATION_PER_ATTEMPT
-                restoration_success = self.simulator.rng.random() < 0.5
-
-                if not restoration_success:
-                    self.gear.awakening_level -= 1
-                    ending_level = self.gear.awakening_level
-            else:
-                self.gear.awakening_level -= 1
-                ending_level = self.gear.awakening_level
+        if restoration_attempted:
+            self.total_scrolls += RESTORATION_PER_ATTEMPT
+            # Add silver cost for restoration attempt
+            # 200 scrolls per attempt, 200K scrolls = 1T → 200 scrolls = 1B
+            self.total_silver += self._restoration_attempt_cost
+            restoration_success = self._random() < RESTORATION_SUCCESS_RATE
+        if starting_level > 0 and not restoration_success:
+            gear.awakening_level = starting_level - 1
+        ending_level = gear.awakening_level
 
         return AttemptResult(
             success=False,
@@ -1061,111 +1267,78 @@ class SimulationScreen(Screen):
             restoration_attempted=restoration_attempted,
             restoration_success=restoration_success,
             valks_used=valks_type,
-            materials_cost=materials,
+            materials_cost=_ATTEMPT_MATERIALS[valks_type, restoration_attempted],
         )
 
+    def _track_max_level(self) -> None:
+        """Record the current level if it is the highest reached so far."""
+        if self.gear.awakening_level > self.max_level_reached:
+            self.max_level_reached = self.gear.awakening_level
+
     def _log_attempt(self, log: RichLog, result: AttemptResult) -> None:
         """Log an enhancement attempt to the RichLog."""
-        from_level = ROMAN_NUMERALS[result.starting_level]
-        to_level = ROMAN_NUMERALS[result.starting_level + 1]
+        log.write(self._format_attempt(result))
+        self._track_max_level()
 
-        parts = [f"[bold]{from_level}[/bold] → [bold]{to_level}[/bold]: "]
+    def _format_attempt(self, result: AttemptResult) -> Text:
+        """Build the log line for an enhancement attempt."""
+        parts = [_LOG_LEVEL_HEADER[result.starting_level]]
 
         if result.anvil_triggered:
-            parts.append("[yellow bold]ANVIL SUCCESS![/yellow bold]")
+            parts.append(_LOG_ANVIL_SUCCESS)
         elif result.success:
-            parts.append("[green]SUCCESS[/green]")
+            parts.append(_LOG_SUCCESS)
         else:
-            parts.append("[red]FAIL[/red]")
+            parts.append(_LOG_FAIL)
 
         if result.valks_used:
-            parts.append(f" [cyan](Valks +{result.valks_used}%)[/cyan]")
+            parts.append(_LOG_VALKS_NOTE[result.valks_used])
 
         if result.restoration_attempted:
             if result.restoration_success:
-                parts.append(" [blue]| Restoration: SAVED[/blue]")
+                parts.append(_LOG_RESTORATION_SAVED)
             else:
-                parts.append(" [red]| Restoration: FAILED[/red]")
-                parts.append(f" [red bold]↓ {ROMAN_NUMERALS[result.ending_level]}[/red bold]")
+                parts.append(_LOG_RESTORATION_FAILED)
+                parts.append(_LOG_DROP_NOTE[result.ending_level])
 
         if result.success and not result.restoration_attempted:
-            parts.append(f" [green bold]↑ Now at +{ROMAN_NUMERALS[result.ending_level]}[/green bold]")
+            parts.append(_LOG_NOW_AT_NOTE[result.ending_level])
 
-        log.write("".join(parts))
+        return Text.assemble(*parts)
 
-        # Track max level
-        if self.gear.awakening_level > self.max_level_reached:
-            self.max_level_reached = self.gear.awakening_level
-
-        # Update level displays
-        self.query_one("#current-display", Static).update(
-            f"Current: +{ROMAN_NUMERALS[self.gear.awakening_level]}"
-        )
-        self.query_one("#max-display", Static).update(
-            f"Max: +{ROMAN_NUMERALS[self.max_level_reached]}"
-        )
-        self.query_one("#attempts-display", Static).update(
-            f"Attempts: {self.target_attempts}"
-        )
-
-        # Update anvil pity display
-        self._update_anvil_pity()
-
-    def _log_hepta_okta_attempt(self, log: RichLog, result: dict, is_okta: bool) -> None:
+    def _log_hepta_okta_attempt(self, log: RichLog, result: SubAttemptResult, is_okta: bool) -> None:
         """Log a Hepta/Okta sub-enhancement attempt."""
-        path_name = "Okta" if is_okta else "Hepta"
-        target = "IX" if is_okta else "VIII"
-        max_subs = OKTA_SUB_ENHANCEMENTS if is_okta else HEPTA_SUB_ENHANCEMENTS
-
-        parts = [f"[cyan]{path_name}[/cyan] ({result['sub_progress']}/{max_subs}): "]
-
-        if result["anvil_triggered"]:
-            parts.append("[yellow bold]ANVIL SUCCESS![/yellow bold]")
-        elif result["success"]:
-            parts.append("[green]SUB SUCCESS[/green]")
-        else:
-            parts.append(f"[red]FAIL[/red] (pity: {result['sub_pity']}/{HEPTA_OKTA_ANVIL_PITY})")
+        log.write(self._format_hepta_okta_attempt(result, is_okta))
 
-        log.write("".join(parts))
+    def _format_hepta_okta_attempt(self, result: SubAttemptResult, is_okta: bool) -> Text:
+        """Build the log line for a Hepta/Okta sub-enhancement attempt."""
+        header = _LOG_SUB_HEADER[is_okta][result.sub_progress]
 
-        # Update displays
-        self.query_one("#current-display", Static).update(
-            f"Current: +{ROMAN_NUMERALS[self.gear.awakening_level]}"
-        )
-        self.query_one("#attempts-display", Static).update(
-            f"Attempts: {self.target_attempts}"
-        )
+        if result.anvil_triggered:
+            return Text.assemble(header, _LOG_ANVIL_SUCCESS)
+        if result.success:
+            return Text.assemble(header, _LOG_SUB_SUCCESS)
+        return Text.assemble(header, _LOG_SUB_FAIL[result.sub_pity])
 
     def _log_hepta_okta_complete(self, log: RichLog, result: dict) -> None:
         """Log completion of Hepta/Okta enhancement path."""
+        log.write(self._format_hepta_okta_complete(result))
+        self._track_max_level()
+
+    def _format_hepta_okta_complete(self, result: dict) -> Text:
+        """Build the (blank-line padded) log lines for a completed Hepta/Okta path."""
         from_level = ROMAN_NUMERALS[result["from"]]
         to_level = ROMAN_NUMERALS[result["to"]]
         path = result["path"]
-
-        log.write("")
-        log.write(f"[bold magenta]═══ {path} COMPLETE! {from_level} → {to_level} ═══[/bold magenta]")
-        log.write("")
-
-        # Track max level
-        if self.gear.awakening_level > self.max_level_reached:
-            self.max_level_reached = self.gear.awakening_level
-
-        # Update displays
-        self.query_one("#current-display", Static).update(
-            f"Current: +{ROMAN_NUMERALS[self.gear.awakening_level]}"
-        )
-        self.query_one("#max-display", Static).update(
-            f"Max: +{ROMAN_NUMERALS[self.max_level_reached]}"
-        )
+        return _log_text(f"\n[bold magenta]═══ {path} COMPLETE! {from_level} → {to_level} ═══[/bold magenta]\n")
 
     def _update_anvil_pity(self) -> None:
         """Update the anvil pity display for levels V-X."""
         # Use snapshot if target was reached, otherwise use live values
-        energy_source = self.final_anvil_snapshot if self.final_anvil_snapshot else self.gear.anvil_energy
-        for level in range(5, 11):
-            current_energy = energy_source.get(level, 0)
-            cap = ANVIL_THRESHOLDS_AWAKENING.get(level, 0)
-            self.query_one(f"#anvil-{level}", Static).update(f"{current_energy}/{cap}")
+        energy_source = self.final_anvil_snapshot if self.final_anvil_snapshot is not None else self.gear.anvil_energy
+        show = self._show
+        for level, display in enumerate(self._anvil_displays, start=5):
+            show(display, f"{energy_source[level]}{_ANVIL_SUFFIXES[level]}")
 
     def _format_silver(self, silver: int) -> str:
         """Format silver amount with K/M/B/T suffix."""
@@ -1177,30 +1350,34 @@ class SimulationScreen(Screen):
 
     def _log_completion(self, log: RichLog) -> None:
         """Log completion message."""
-        log.write("")
-        log.write("[bold green]════════════════════════════════════════[/bold green]")
-        log.write(f"[bold green]  REACHED +{ROMAN_NUMERALS[self.config.target_level]}![/bold green]")
-        log.write("[bold green]════════════════════════════════════════[/bold green]")
-        log.write("")
-        log.write("[bold]Final Statistics:[/bold]")
-        log.write(f"  Total Attempts: {self.attempt_count}")
-        log.write("")
-        log.write("[bold]Resources Spent:[/bold]")
-        log.write(f"  Crystals: {self.total_crystals}")
+        lines = [
+            "",
+            "[bold green]════════════════════════════════════════[/bold green]",
+            f"[bold green]  REACHED +{ROMAN_NUMERALS[self.config.target_level]}![/bold green]",
+            "[bold green]════════════════════════════════════════[/bold green]",
+            "",
+            "[bold]Final Statistics:[/bold]",
+            f"  Total Attempts: {self.attempt_count}",
+            "",
+            "[bold]Resources Spent:[/bold]",
+            f"  Crystals: {self.total_crystals}",
+        ]
         if self.total_exquisite_crystals > 0:
-            log.write(f"  Exquisite Black Crystals: {self.total_exquisite_crystals}")
-        log.write(f"  Restoration Scrolls: {self.total_scrolls:,}")
+            lines.append(f"  Exquisite Black Crystals: {self.total_exquisite_crystals}")
+        lines.append(f"  Restoration Scrolls: {self.total_scrolls:,}")
         if self.total_valks_10 > 0:
-            log.write(f"  Valks +10%: {self.total_valks_10}")
+            lines.append(f"  Valks +10%: {self.total_valks_10}")
         if self.total_valks_50 > 0:
-            log.write(f"  Valks +50%: {self.total_valks_50}")
+            lines.append(f"  Valks +50%: {self.total_valks_50}")
         if self.total_valks_100 > 0:
-            log.write(f"  Valks +100%: {self.total_valks_100}")
-        log.write(f"  [yellow bold]Silver Total: {self._format_silver(self.total_silver)}[/yellow bold]")
+            lines.append(f"  Valks +100%: {self.total_valks_100}")
+        lines.append(f"  [yellow bold]Silver Total: {self._format_silver(self.total_silver)}[/yellow bold]")
+        # One write instead of one per line
+        log.write("\n".join(lines))
 
     def _is_regular_mode(self) -> bool:
         """Check if running in Regular (in-game speed) mode."""
-        return self.config.speed >= 1.0
+        return self.config.speed == 1
 
     async def _flash_effect(self, color: str, duration: float = 0.15) -> None:
         """Apply a flash effect by changing log container border color."""
@@ -1224,47 +1401,78 @@ class SimulationScreen(Screen):
         else:
             await self._flash_effect("red", 0.12)
 
-    async def _victory_celebration(self, log: RichLog) -> None:
-        """Epic victory celebration animation (only in Regular mode)."""
+    def _victory_celebration(self, log: RichLog) -> None:
+        """Epic victory celebration animation, followed by the completion log.
+
+        Outside Regular mode the completion message is logged right away.
+        Animation frames are played back on a fixed-rate timer instead of
+        sleeping between individual style changes and writes.
+        """
         if not self._is_regular_mode():
+            self._log_completion(log)
             return
 
         target = ROMAN_NUMERALS[self.config.target_level]
-        log_container = self.query_one("#log-container", RichLog)
         caption = self.query_one("#level-caption", Horizontal)
 
-        # Rapid flash sequence - the "flashbang"
-        for _ in range(4):
-            log_container.styles.border = ("heavy", "white")
-            caption.styles.background = "white"
-            self.refresh()
-            await asyncio.sleep(0.06)
-            log_container.styles.border = ("heavy", "gold")
-            caption.styles.background = "darkgoldenrod"
-            self.refresh()
-            await asyncio.sleep(0.08)
-
-        # Hold victory glow with golden theme
-        log_container.styles.border = ("double", "gold")
-        caption.styles.background = "darkgoldenrod"
-        self.refresh()
+        def glow(border: tuple[str, str], background: str) -> Callable[[], None]:
+            def frame() -> None:
+                log.styles.border = border
+                caption.styles.background = background
+            return frame
 
-        # ASCII art celebration
-        log.write("")
-        log.write("[bold yellow]★ ═══════════════════════════════════════════ ★[/bold yellow]")
-        log.write("[bold yellow]║                                               ║[/bold yellow]")
-        await asyncio.sleep(0.15)
-        log.write(f"[bold yellow]║      ✦  ✦  ✦   +{target} ACHIEVED!   ✦  ✦  ✦      ║[/bold yellow]")
-        await asyncio.sleep(0.15)
-        log.write("[bold yellow]║                                               ║[/bold yellow]")
-        log.write("[bold yellow]★ ═══════════════════════════════════════════ ★[/bold yellow]")
-        log.write("")
+        # Rapid flash sequence - the "flashbang"
+        frames = [glow(("heavy", "white"), "white"), glow(("heavy", "gold"), "darkgoldenrod")] * 4
+        # Hold victory glow with golden theme, then the ASCII art celebration
+        frames.append(glow(("double", "gold"), "darkgoldenrod"))
+        frames.append(partial(log.write, "\n".join([
+            "",
+            "[bold yellow]★ ═══════════════════════════════════════════ ★[/bold yellow]",
+            "[bold yellow]║                                               ║[/bold yellow]",
+            f"[bold yellow]║      ✦  ✦  ✦   +{target} ACHIEVED!   ✦  ✦  ✦      ║[/bold yellow]",
+            "[bold yellow]║                                               ║[/bold yellow]",
+            "[bold yellow]★ ═══════════════════════════════════════════ ★[/bold yellow]",
+            "",
+        ])))
+        pending = iter(frames)
+
+        def tick() -> None:
+            frame = next(pending, None)
+            if frame is not None:
+                frame()
+                return
+            # Keep the golden glow for a moment before showing the stats
+            self._celebration_timer.stop()
+            self._celebration_timer = self.set_timer(
+                _VICTORY_HOLD_SECONDS, partial(self._log_completion, log)
+            )
 
-        # Keep the golden glow for the stats display
-        await asyncio.sleep(1.5)
+        self._celebration_timer = self.set_interval(_VICTORY_FRAME_INTERVAL, tick)
 
     def _update_stats(self) -> None:
-        """Update statistics display."""
+        """Mark the caption and stats panels stale; they are redrawn on the next display tick."""
+        self._stats_dirty = True
+
+    def _flush_stats(self) -> None:
+        """Redraw the caption and stats panels if anything changed since the last tick."""
+        if self._stats_dirty:
+            self._stats_dirty = False
+            self._render_stats()
+
+    def _show(self, widget: Static, text: str) -> None:
+        """Update a caption/stats widget, skipping the refresh if its text is unchanged."""
+        if self._shown_text.get(widget) != text:
+            self._shown_text[widget] = text
+            widget.update(text)
+
+    def _render_stats(self) -> None:
+        """Update level caption and statistics display."""
+        show = self._show
+        # Level caption
+        show(self._current_display, f"Current: +{ROMAN_NUMERALS[self.gear.awakening_level]}")
+        show(self._max_display, f"Max: +{ROMAN_NUMERALS[self.max_level_reached]}")
+        show(self._attempts_display, f"Attempts: {self.target_attempts}")
+
         # Left column: Anvil pity
         self._update_anvil_pity()
 
@@ -1273,24 +1481,25 @@ class SimulationScreen(Screen):
             hepta_text = f"{self.hepta_sub_progress}/{HEPTA_SUB_ENHANCEMENTS} ({self.hepta_sub_pity}/{HEPTA_OKTA_ANVIL_PITY})"
         else:
             hepta_text = "-"
-        self.query_one("#hepta-progress", Static).update(hepta_text)
+        show(self._hepta_display, hepta_text)
 
         if self.config.use_okta:
             okta_text = f"{self.okta_sub_progress}/{OKTA_SUB_ENHANCEMENTS} ({self.okta_sub_pity}/{HEPTA_OKTA_ANVIL_PITY})"
         else:
             okta_text = "-"
-        self.query_one("#okta-progress", Static).update(okta_text)
+        show(self._okta_display, okta_text)
 
         # Right column: Resources
-        self.query_one("#stat-crystals", Static).update(str(self.total_crystals))
-        self.query_one("#stat-exquisite", Static).update(str(self.total_exquisite_crystals))
-        self.query_one("#stat-scrolls", Static).update(f"{self.total_scrolls:,}")
-        self.query_one("#stat-valks-10", Static).update(str(self.total_valks_10))
-        self.query_one("#stat-valks-50", Static).update(str(self.total_valks_50))
-        self.query_one("#stat-valks-100", Static).update(str(self.total_valks_100))
-        self.query_one("#stat-silver", Static).update(self._format_silver(self.total_silver))
+        stats = self._stat_displays
+        show(stats["crystals"], str(self.total_crystals))
+        show(stats["exquisite"], str(self.total_exquisite_crystals))
+        show(stats["scrolls"], f"{self.total_scrolls:,}")
+        show(stats["valks-10"], str(self.total_valks_10))
+        show(stats["valks-50"], str(self.total_valks_50))
+        show(stats["valks-100"], str(self.total_valks_100))
+        show(stats["silver"], self._format_silver(self.total_silver))
         # Time spent: 1 second per enhancement attempt
-        self.query_one("#stat-time", Static).update(self._format_time(self.attempt_count))
+        show(stats["time"], self._format_time(self.attempt_count))
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "back-button":
@@ -1319,6 +1528,12 @@ class SimulationScreen(Screen):
     def action_restart(self) -> None:
         """Restart the simulation."""
         self.running = False
+        if self._instant_job is not None:
+            # The worker thread is still mutating the state reset below; restart once it stops
+            if not self._restart_queued:
+                self._restart_queued = True
+                self._instant_job.add_done_callback(self._restart_after_instant_job)
+            return
         self.paused = False
         # Reset pause button
         pause_btn = self.query_one("#pause-button", Button)
@@ -1342,8 +1557,11 @@ class SimulationScreen(Screen):
         self.okta_sub_progress = self.config.start_okta
         self.hepta_sub_pity = 0
         self.okta_sub_pity = 0
-        # Reset anvil snapshot
+        # Reset anvil snapshot and drop any unfinished victory animation
         self.final_anvil_snapshot = None
+        if self._celebration_timer is not None:
+            self._celebration_timer.stop()
+            self._celebration_timer = None
 
         # Clear log
         log = self.query_one("#log-container", RichLog)
@@ -1351,19 +1569,159 @@ class SimulationScreen(Screen):
 
         # Update displays
         self._update_stats()
-        self.query_one("#current-display", Static).update(f"Current: +{ROMAN_NUMERALS[self.config.start_level]}")
-        self.query_one("#max-display", Static).update(f"Max: +{ROMAN_NUMERALS[self.config.start_level]}")
-        self.query_one("#attempts-display", Static).update("Attempts: 0")
 
         # Restart
         self.run_simulation()
 
+    def _restart_after_instant_job(self, _job: asyncio.Future) -> None:
+        """Run a restart that was deferred until the instant-mode thread stopped."""
+        self._restart_queued = False
+        self.call_later(self.action_restart)
+
     def action_quit(self) -> None:
         self.running = False
         self.app.exit()
 
 
-class HeptaOktaStrategyScreen(Screen):
+class StrategyScreenMixin:
+    """Shared lifecycle, table drawing and controls of the strategy analysis screens.
+
+    Screens mix this in ahead of Screen, build self._table_header in __init__ and
+    provide _run_analysis() and the table layout class attributes: TABLE_LABELS
+    (strategy key -> row label), TABLE_AMOUNT_COLUMNS ((result row index, width) per
+    amount cell, in display order), TABLE_LABEL_WIDTH (label column), TABLE_WIDTH
+    (rule) and TABLE_WAITING_CELLS (amount cells shown while a strategy is still running).
+    """
+
+    def __init__(self, config: SimConfig, num_simulations: int = 1000):
+        super().__init__()
+        self.config = config
+        self.num_simulations = num_simulations
+        self.running = False
+        self.results = {}
+        self._task: asyncio.Task | None = None
+        # Every strategy gets its own seed, drawn in display order, and each of its
+        # simulations runs on that seed plus its index (_submit_strategy_jobs), so a
+        # seeded analysis (config.seed) gives the same table whatever the pool size
+        self._job_seeds = random.Random(config.seed)
+        # Latest table redraw arguments waiting for the debounce timer
+        self._pending_table: Optional[tuple] = None
+        self._redraw_timer: Optional[Timer] = None
+        # Formatted silver strings; the same P50/P90/worst values recur on every redraw
+        self._silver_text: dict[int, str] = {}
+
+    async def on_mount(self) -> None:
+        """Start the analysis when screen is mounted."""
+        self.running = True
+        self._task = asyncio.create_task(self._run_analysis())
+
+    async def on_unmount(self) -> None:
+        """Cancel task when screen is unmounted."""
+        await self._cancel_task()
+
+    async def _cancel_task(self) -> None:
+        """Cancel the running analysis task and clean up."""
+        self.running = False
+        if self._task is not None:
+            if not self._task.done():
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            self._task = None
+
+    def _format_amounts(self, row: tuple) -> str:
+        """Format the amount cells of one result row per TABLE_AMOUNT_COLUMNS."""
+        return " ".join(
+            f"{self._format_silver(row[index]) if index == _SILVER_INDEX else row[index]:>{width}}"
+            for index, width in self.TABLE_AMOUNT_COLUMNS
+        )
+
+    def _schedule_redraw(self, log: RichLog, results: dict, keys: tuple) -> None:
+        """Queue a table redraw; requests within _TABLE_REDRAW_INTERVAL share one draw."""
+        self._pending_table = (log, results, keys)
+        if self._redraw_timer is None:
+            self._redraw_timer = self.set_timer(_TABLE_REDRAW_INTERVAL, self._flush_table)
+
+    async def _flush_table(self) -> None:
+        """Draw the most recently queued table, if any."""
+        self._redraw_timer = None
+        pending, self._pending_table = self._pending_table, None
+        if pending is not None:
+            await self._redraw_table(*pending)
+
+    def _cancel_pending_redraw(self) -> None:
+        """Drop a queued table redraw."""
+        if self._redraw_timer is not None:
+            self._redraw_timer.stop()
+            self._redraw_timer = None
+        self._pending_table = None
+
+    async def _redraw_table(self, log: RichLog, results: dict, keys: tuple, final: bool = False) -> None:
+        """Redraw the results table."""
+        lines = [self._table_header]
+        width = self.TABLE_LABEL_WIDTH
+
+        # Sort by p50 silver if final (the first entry is the best), otherwise keep original order
+        best_strategy = None
+        if final:
+            display_order = sorted(results.keys(), key=lambda k: results[k].p50[2])
+            if display_order:
+                best_strategy = display_order[0]
+        else:
+            display_order = keys
+
+        for key in display_order:
+            r = results.get(key)
+            if r is not None:
+                progress = f"{r.progress}%"
+
+                # P50 row
+                if key == best_strategy:
+                    lines.append(f"[green bold]{r.label:<{width}} {progress:>6} {self._format_amounts(r.p50)} ★ P50[/green bold]")
+                else:
+                    lines.append(f"{r.label:<{width}} {progress:>6} {self._format_amounts(r.p50)}    P50")
+
+                # P90 and worst rows
+                lines.append(f"{'':{width}} {'':>6} {self._format_amounts(r.p90)}    P90")
+                lines.append(f"{'':{width}} {'':>6} {self._format_amounts(r.worst)}    Worst")
+                lines.append("")
+            else:
+                lines.append(f"{self.TABLE_LABELS[key]:<{width}} {'wait':>6} {self.TABLE_WAITING_CELLS}")
+
+        lines.append("-" * self.TABLE_WIDTH)
+
+        if best_strategy is not None:
+            best_label = results[best_strategy].label
+            best_p50_silver = self._format_silver(results[best_strategy].p50[2])
+            lines.append(f"\n[bold green]★ Recommended: {best_label} (P50 Silver: {best_p50_silver})[/bold green]")
+
+        # Single write so the table is parsed and laid out once
+        log.clear()
+        log.write("\n".join(lines))
+
+    def _format_silver(self, silver: int) -> str:
+        """Format silver amount with K/M/B/T suffix, memoized across table redraws."""
+        text = self._silver_text.get(silver)
+        if text is None:
+            text = self._silver_text[silver] = format_silver(silver)
+        return text
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "back-button":
+            await self.action_back()
+
+    async def action_back(self) -> None:
+        await self._cancel_task()
+        self.app.pop_screen()
+
+    async def action_quit(self) -> None:
+        await self._cancel_task()
+        self.app.exit()
+
+
+class HeptaOktaStrategyScreen(StrategyScreenMixin, Screen):
     """Screen for Monte Carlo Hepta/Okta strategy analysis."""
 
     CSS = """
@@ -1410,13 +1768,28 @@ class HeptaOktaStrategyScreen(Screen):
         Binding("escape", "back", "Back to Config"),
     ]
 
+    TABLE_LABELS = _HEPTA_OKTA_STRATEGY_LABELS
+    # Crystals, Exquisite, Scrolls, Silver
+    TABLE_AMOUNT_COLUMNS = ((0, 10), (3, 10), (1, 10), (_SILVER_INDEX, 12))
+    TABLE_LABEL_WIDTH = 12
+    TABLE_WIDTH = 64
+    TABLE_WAITING_CELLS = f"{'-':>10} {'-':>10} {'-':>10} {'-':>12}"
+
     def __init__(self, config: SimConfig, num_simulations: int = 1000):
-        super().__init__()
-        self.config = config
-        self.num_simulations = num_simulations
-        self.running = False
-        self.results = {}
-        self._task: asyncio.Task | None = None
+        super().__init__(config, num_simulations)
+        # Title and column header lines are fixed for the screen's lifetime
+        start_info = f"Start: +{ROMAN_NUMERALS[config.start_level]}"
+        if config.start_hepta > 0:
+            start_info += f" (Hepta {config.start_hepta}/5)"
+        if config.start_okta > 0:
+            start_info += f" (Okta {config.start_okta}/10)"
+        self._table_header = "\n".join((
+            "[bold]Monte Carlo Hepta/Okta Strategy Analysis[/bold]",
+            f"{start_info} → Target: +{ROMAN_NUMERALS[config.target_level]}, Simulations: {num_simulations}",
+            "Restoration: from +VI (fixed)\n",
+            f"{'Strategy':<12} {'Prog.':>6} {'Crystals':>10} {'Exquisite':>10} {'Scrolls':>10} {'Silver':>12}",
+            "-" * 64,
+        ))
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -1434,53 +1807,17 @@ class HeptaOktaStrategyScreen(Screen):
 
         yield Footer()
 
-    async def on_mount(self) -> None:
-        """Start the analysis when screen is mounted."""
-        self.running = True
-        self._task = asyncio.create_task(self._run_analysis())
-
-    async def on_unmount(self) -> None:
-        """Cancel task when screen is unmounted."""
-        await self._cancel_task()
-
-    async def _cancel_task(self) -> None:
-        """Cancel the running analysis task and clean up."""
-        self.running = False
-        if self._task is not None:
-            if not self._task.done():
-                self._task.cancel()
-                try:
-                    await self._task
-                except asyncio.CancelledError:
-                    pass
-            self._task = None
-
     async def _run_analysis(self) -> None:
         """Run Monte Carlo analysis for different Hepta/Okta strategies."""
         try:
             log = self.query_one("#results-container", RichLog)
             status = self.query_one("#status", Static)
 
-            log.write("[bold]Monte Carlo Hepta/Okta Strategy Analysis[/bold]")
-            start_info = f"Start: +{ROMAN_NUMERALS[self.config.start_level]}"
-            if self.config.start_hepta > 0:
-                start_info += f" (Hepta {self.config.start_hepta}/5)"
-            if self.config.start_okta > 0:
-                start_info += f" (Okta {self.config.start_okta}/10)"
-            log.write(f"{start_info} → Target: +{ROMAN_NUMERALS[self.config.target_level]}, Simulations: {self.num_simulations}")
-            log.write("Restoration: from +VI (fixed)\n")
-
             # Test 4 Hepta/Okta combinations with restoration from VI
-            # Format: (use_hepta, use_okta, label)
-            strategies = [
-                (True, True, "Hepta+Okta"),
-                (True, False, "Hepta only"),
-                (False, True, "Okta only"),
-                (False, False, "Normal"),
-            ]
+            strategies = _HEPTA_OKTA_STRATEGIES
             results = {}
 
-            await self._redraw_table(log, results, strategies)
+            await self._redraw_table(log, results, _HEPTA_OKTA_STRATEGY_KEYS)
             await asyncio.sleep(0.01)
 
             # Pre-create engine prices once (avoid repeated object creation)
@@ -1493,76 +1830,84 @@ class HeptaOktaStrategyScreen(Screen):
                 valks_100_price=prices.valks_100_price,
             )
 
-            # Run simulations for each strategy
-            # Yield every 5 simulations for responsive UI
-            batch_size = 5
+            # All strategies are submitted up front and run in parallel on the app's
+            # worker processes, in jobs of _JOB_SIZE simulations
             num_sims = self.num_simulations  # Local var for speed
             silver_key = itemgetter(2)  # Pre-create sort key
+            next_seed = self._job_seeds.getrandbits  # One seed per strategy, in display order
+            loop = asyncio.get_running_loop()
+            pool = self.app.analysis_pool
+            strategy_jobs = []
+
+            # Config fields shared by every strategy; only the Hepta/Okta flags vary
+            base_kwargs = dict(
+                start_level=self.config.start_level,
+                target_level=self.config.target_level,
+                restoration_from=6,  # Fixed at +VI
+                start_hepta=self.config.start_hepta,
+                start_okta=self.config.start_okta,
+                valks_10_from=self.config.valks_10_from,
+                valks_50_from=self.config.valks_50_from,
+                valks_100_from=self.config.valks_100_from,
+                prices=engine_prices,
+            )
 
-            for use_hepta, use_okta, label in strategies:
-                if not self.running:
-                    break
-
-                status.update(f"Status: Testing {label}...")
-                strategy_key = (use_hepta, use_okta)
-
-                # Create config once per strategy
-                engine_config = EngineConfig(
-                    start_level=self.config.start_level,
-                    target_level=self.config.target_level,
-                    restoration_from=6,  # Fixed at +VI
-                    use_hepta=use_hepta,
-                    use_okta=use_okta,
-                    start_hepta=self.config.start_hepta,
-                    start_okta=self.config.start_okta,
-                    valks_10_from=self.config.valks_10_from,
-                    valks_50_from=self.config.valks_50_from,
-                    valks_100_from=self.config.valks_100_from,
-                    prices=engine_prices,
-                )
-
-                # Create engine once per strategy, reuse with reset()
-                engine = EnhancementEngine(engine_config)
-                sim_results = []  # List of (crystals, scrolls, silver, exquisite)
+            try:
+                for use_hepta, use_okta, label in strategies:
+                    engine_config = EngineConfig(use_hepta=use_hepta, use_okta=use_okta, **base_kwargs)
+                    strategy_jobs.append(_submit_strategy_jobs(loop, pool, engine_config, num_sims, next_seed(64)))
 
-                for i in range(num_sims):
+                # Collect in display order while later strategies keep running
+                for (use_hepta, use_okta, label), jobs in zip(strategies, strategy_jobs):
                     if not self.running:
                         break
-                    # Use fast path - returns tuple directly, no dataclass overhead
-                    result = engine.run_fast()
-                    sim_results.append(result)
-                    engine.reset()  # Reset for next simulation
 
-                    # Update progress periodically (just status, not full table)
-                    if (i + 1) % batch_size == 0:
-                        progress = int((i + 1) / num_sims * 100)
-                        status.update(f"Status: Testing {label}... {progress}%")
-                        await asyncio.sleep(0)  # Yield to event loop
+                    status.update(f"Status: Testing {label}...")
+                    strategy_key = (use_hepta, use_okta)
+                    sim_results = []  # List of (crystals, scrolls, silver, exquisite)
+                    shown_progress = -1
 
-                if not self.running:
-                    break
-
-                # Sort only once at the end of each strategy
-                if sim_results:
-                    sorted_by_silver = sorted(sim_results, key=silver_key)
-                    p50_idx = len(sorted_by_silver) // 2
-                    p90_idx = int(len(sorted_by_silver) * 0.9)
+                    for job in jobs:
+                        if not self.running:
+                            break
+                        sim_results.extend(await job)
 
-                    results[strategy_key] = {
-                        "p50": sorted_by_silver[p50_idx],
-                        "p90": sorted_by_silver[p90_idx],
-                        "worst": sorted_by_silver[-1],
-                        "label": label,
-                        "progress": 100,
-                    }
+                        # Update progress (just status, not full table) only when the percentage moves
+                        progress = len(sim_results) * 100 // num_sims
+                        if progress != shown_progress:
+                            shown_progress = progress
+                            status.update(f"Status: Testing {label}... {progress}%")
 
-                    # Redraw table after completing each strategy
-                    await self._redraw_table(log, results, strategies)
-                    await asyncio.sleep(0)
+                    if not self.running:
+                        break
 
-            # Final redraw with best highlighted
+                    # Sort only once at the end of each strategy
+                    if sim_results:
+                        sorted_by_silver = sorted(sim_results, key=silver_key)
+                        p50_idx = len(sorted_by_silver) // 2
+                        p90_idx = int(len(sorted_by_silver) * 0.9)
+
+                        results[strategy_key] = StrategyResult(
+                            p50=sorted_by_silver[p50_idx],
+                            p90=sorted_by_silver[p90_idx],
+                            worst=sorted_by_silver[-1],
+                            label=label,
+                            progress=100,
+                        )
+
+                        # Redraw table after completing each strategy
+                        self._schedule_redraw(log, results, _HEPTA_OKTA_STRATEGY_KEYS)
+                        await asyncio.sleep(0)
+            finally:
+                # Drop this run's queued jobs; in-flight ones finish on their own
+                for jobs in strategy_jobs:
+                    for job in jobs:
+                        job.cancel()
+
+            # Final redraw with best highlighted, drawn right away over any queued one
             if results and self.running:
-                await self._redraw_table(log, results, strategies, final=True)
+                self._cancel_pending_redraw()
+                await self._redraw_table(log, results, _HEPTA_OKTA_STRATEGY_KEYS, final=True)
 
             status.update("Status: Complete!")
         except asyncio.CancelledError:
@@ -1571,84 +1916,8 @@ class HeptaOktaStrategyScreen(Screen):
         finally:
             self.running = False
 
-    async def _redraw_table(self, log: RichLog, results: dict, strategies: list, final: bool = False) -> None:
-        """Redraw the results table."""
-        log.clear()
-        log.write("[bold]Monte Carlo Hepta/Okta Strategy Analysis[/bold]")
-        start_info = f"Start: +{ROMAN_NUMERALS[self.config.start_level]}"
-        if self.config.start_hepta > 0:
-            start_info += f" (Hepta {self.config.start_hepta}/5)"
-        if self.config.start_okta > 0:
-            start_info += f" (Okta {self.config.start_okta}/10)"
-        log.write(f"{start_info} → Target: +{ROMAN_NUMERALS[self.config.target_level]}, Simulations: {self.num_simulations}")
-        log.write("Restoration: from +VI (fixed)\n")
-
-        # Header
-        log.write(f"{'Strategy':<12} {'Prog.':>6} {'Crystals':>10} {'Exquisite':>10} {'Scrolls':>10} {'Silver':>12}")
-        log.write("-" * 64)
-
-        # Find best strategy if final
-        best_strategy = None
-        if final and results:
-            best_strategy = min(results.keys(), key=lambda k: results[k]["p50"][2])  # Sort by silver
-
-        # Sort by p50 silver if final, otherwise keep original order
-        if final:
-            display_order = sorted(results.keys(), key=lambda k: results[k]["p50"][2])
-        else:
-            display_order = [(h, o) for h, o, _ in strategies]
-
-        for strategy_key in display_order:
-            if strategy_key in results:
-                r = results[strategy_key]
-                label = r["label"]
-                progress = f"{r['progress']}%"
-
-                # P50 row (crystals, scrolls, silver, exquisite)
-                p50_crystals, p50_scrolls, p50_silver, p50_exquisite = r["p50"]
-                if final and strategy_key == best_strategy:
-                    log.write(f"[green bold]{label:<12} {progress:>6} {p50_crystals:>10} {p50_exquisite:>10} {p50_scrolls:>10} {self._format_silver(p50_silver):>12} ★ P50[/green bold]")
-                else:
-                    log.write(f"{label:<12} {progress:>6} {p50_crystals:>10} {p50_exquisite:>10} {p50_scrolls:>10} {self._format_silver(p50_silver):>12}    P50")
-
-                # P90 row
-                p90_crystals, p90_scrolls, p90_silver, p90_exquisite = r["p90"]
-                log.write(f"{'':12} {'':>6} {p90_crystals:>10} {p90_exquisite:>10} {p90_scrolls:>10} {self._format_silver(p90_silver):>12}    P90")
-
-                # Worst row
-                worst_crystals, worst_scrolls, worst_silver, worst_exquisite = r["worst"]
-                log.write(f"{'':12} {'':>6} {worst_crystals:>10} {worst_exquisite:>10} {worst_scrolls:>10} {self._format_silver(worst_silver):>12}    Worst")
-                log.write("")
-            else:
-                use_hepta, use_okta = strategy_key
-                label = next((l for h, o, l in strategies if h == use_hepta and o == use_okta), "Unknown")
-                log.write(f"{label:<12} {'wait':>6} {'-':>10} {'-':>10} {'-':>10} {'-':>12}")
-
-        log.write("-" * 64)
-
-        if final and best_strategy is not None:
-            best_label = results[best_strategy]["label"]
-            best_p50_silver = self._format_silver(results[best_strategy]["p50"][2])
-            log.write(f"\n[bold green]★ Recommended: {best_label} (P50 Silver: {best_p50_silver})[/bold green]")
 
-    def _format_silver(self, silver: int) -> str:
-        """Format silver amount with K/M/B/T suffix."""
-        return format_silver(silver)
-
-    async def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "back-button":
-            await self.action_back()
-
-    async def action_back(self) -> None:
-        await self._cancel_task()
-        self.app.pop_screen()
-
-    async def action_quit(self) -> None:
-        await self._cancel_task()
-        self.app.exit()
-
-
-class RestorationStrategyScreen(Screen):
+class RestorationStrategyScreen(StrategyScreenMixin, Screen):
     """Screen for Monte Carlo restoration level strategy analysis."""
 
     CSS = """
@@ -1695,13 +1964,22 @@ class RestorationStrategyScreen(Screen):
         Binding("escape", "back", "Back to Config"),
     ]
 
+    TABLE_LABELS = _RESTORATION_LABELS
+    # Crystals, Scrolls, Silver
+    TABLE_AMOUNT_COLUMNS = ((0, 10), (1, 10), (_SILVER_INDEX, 12))
+    TABLE_LABEL_WIDTH = 10
+    TABLE_WIDTH = 52
+    TABLE_WAITING_CELLS = f"{'-':>10} {'-':>10} {'-':>12}"
+
     def __init__(self, config: SimConfig, num_simulations: int = 1000):
-        super().__init__()
-        self.config = config
-        self.num_simulations = num_simulations
-        self.running = False
-        self.results = {}
-        self._task: asyncio.Task | None = None
+        super().__init__(config, num_simulations)
+        # Title and column header lines are fixed for the screen's lifetime
+        self._table_header = "\n".join((
+            "[bold]Monte Carlo Restoration Strategy Analysis[/bold]",
+            f"Start: +{ROMAN_NUMERALS[config.start_level]} → Target: +{ROMAN_NUMERALS[config.target_level]}, Simulations: {num_simulations}\n",
+            f"{'Rest.From':<10} {'Prog.':>6} {'Crystals':>10} {'Scrolls':>10} {'Silver':>12}",
+            "-" * 52,
+        ))
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -1719,38 +1997,14 @@ class RestorationStrategyScreen(Screen):
 
         yield Footer()
 
-    async def on_mount(self) -> None:
-        """Start the analysis when screen is mounted."""
-        self.running = True
-        self._task = asyncio.create_task(self._run_analysis())
-
-    async def on_unmount(self) -> None:
-        """Cancel task when screen is unmounted."""
-        await self._cancel_task()
-
-    async def _cancel_task(self) -> None:
-        """Cancel the running analysis task and clean up."""
-        self.running = False
-        if self._task is not None:
-            if not self._task.done():
-                self._task.cancel()
-                try:
-                    await self._task
-                except asyncio.CancelledError:
-                    pass
-            self._task = None
-
     async def _run_analysis(self) -> None:
         """Run Monte Carlo analysis for different restoration strategies."""
         try:
             log = self.query_one("#results-container", RichLog)
             status = self.query_one("#status", Static)
 
-            log.write("[bold]Monte Carlo Restoration Strategy Analysis[/bold]")
-            log.write(f"Start: +{ROMAN_NUMERALS[self.config.start_level]} → Target: +{ROMAN_NUMERALS[self.config.target_level]}, Simulations: {self.num_simulations}\n")
-
             # Test restoration starting from IV(4), V(5), VI(6), VII(7), VIII(8) up to target-1
-            restoration_options = [i for i in range(4, self.config.target_level)]
+            restoration_options = tuple(range(4, self.config.target_level))
             results = {}
 
             await self._redraw_table(log, results, restoration_options)
@@ -1766,79 +2020,89 @@ class RestorationStrategyScreen(Screen):
                 valks_100_price=prices.valks_100_price,
             )
 
-            # Run simulations for each strategy
-            # Yield every 5 simulations for responsive UI
-            batch_size = 5
+            # All strategies are submitted up front and run in parallel on the app's
+            # worker processes, in jobs of _JOB_SIZE simulations
             num_sims = self.num_simulations  # Local var for speed
             silver_key = itemgetter(2)  # Pre-create sort key
+            next_seed = self._job_seeds.getrandbits  # One seed per strategy, in display order
+            first3 = itemgetter(0, 1, 2)  # (crystals, scrolls, silver) of a result
+            loop = asyncio.get_running_loop()
+            pool = self.app.analysis_pool
+            strategy_jobs = []
+
+            # Config fields shared by every strategy; only restoration_from varies
+            base_kwargs = dict(
+                start_level=self.config.start_level,
+                target_level=self.config.target_level,
+                use_hepta=False,
+                use_okta=False,
+                start_hepta=self.config.start_hepta,
+                start_okta=self.config.start_okta,
+                valks_10_from=self.config.valks_10_from,
+                valks_50_from=self.config.valks_50_from,
+                valks_100_from=self.config.valks_100_from,
+                prices=engine_prices,
+            )
 
-            for rest_from in restoration_options:
-                if not self.running:
-                    break
+            try:
+                for rest_from in restoration_options:
+                    engine_config = EngineConfig(restoration_from=rest_from, **base_kwargs)
+                    strategy_jobs.append(_submit_strategy_jobs(loop, pool, engine_config, num_sims, next_seed(64)))
 
-                rest_label = f"+{ROMAN_NUMERALS[rest_from]}"
-                status.update(f"Status: Testing restoration from {rest_label}...")
-
-                # Create config once per strategy
-                engine_config = EngineConfig(
-                    start_level=self.config.start_level,
-                    target_level=self.config.target_level,
-                    restoration_from=rest_from,
-                    use_hepta=False,
-                    use_okta=False,
-                    start_hepta=self.config.start_hepta,
-                    start_okta=self.config.start_okta,
-                    valks_10_from=self.config.valks_10_from,
-                    valks_50_from=self.config.valks_50_from,
-                    valks_100_from=self.config.valks_100_from,
-                    prices=engine_prices,
-                )
+                # Collect in display order while later strategies keep running
+                for rest_from, jobs in zip(restoration_options, strategy_jobs):
+                    if not self.running:
+                        break
 
-                # Create engine once per strategy, reuse with reset()
-                engine = EnhancementEngine(engine_config)
-                sim_results = []  # List of (crystals, scrolls, silver)
+                    rest_label = _RESTORATION_LABELS[rest_from]
+                    status.update(f"Status: Testing restoration from {rest_label}...")
+                    sim_results = []  # List of (crystals, scrolls, silver)
+                    shown_progress = -1
+
+                    for job in jobs:
+                        if not self.running:
+                            break
+                        # Only take first 3 elements (crystals, scrolls, silver) for this screen
+                        sim_results.extend(map(first3, await job))
+
+                        # Update progress (just status, not full table) only when the percentage moves
+                        progress = len(sim_results) * 100 // num_sims
+                        if progress != shown_progress:
+                            shown_progress = progress
+                            status.update(f"Status: Testing restoration from {rest_label}... {progress}%")
 
-                for i in range(num_sims):
                     if not self.running:
                         break
-                    # Use fast path - returns tuple directly, no dataclass overhead
-                    result = engine.run_fast()
-                    # Only take first 3 elements (crystals, scrolls, silver) for this screen
-                    sim_results.append((result[0], result[1], result[2]))
-                    engine.reset()  # Reset for next simulation
-
-                    # Update progress periodically (just status, not full table)
-                    if (i + 1) % batch_size == 0:
-                        progress = int((i + 1) / num_sims * 100)
-                        status.update(f"Status: Testing restoration from {rest_label}... {progress}%")
-                        await asyncio.sleep(0)  # Yield to event loop
 
-                if not self.running:
-                    break
+                    # Skip processing if cancelled mid-simulation
+                    if not sim_results:
+                        continue
 
-                # Skip processing if cancelled mid-simulation
-                if not sim_results:
-                    continue
-
-                # Sort only once at the end of each strategy
-                sorted_by_silver = sorted(sim_results, key=silver_key)
-                p50_idx = len(sorted_by_silver) // 2
-                p90_idx = int(len(sorted_by_silver) * 0.9)
+                    # Sort only once at the end of each strategy
+                    sorted_by_silver = sorted(sim_results, key=silver_key)
+                    p50_idx = len(sorted_by_silver) // 2
+                    p90_idx = int(len(sorted_by_silver) * 0.9)
 
-                results[rest_from] = {
-                    "p50": sorted_by_silver[p50_idx],
-                    "p90": sorted_by_silver[p90_idx],
-                    "worst": sorted_by_silver[-1],
-                    "label": rest_label,
-                    "progress": 100,
-                }
+                    results[rest_from] = StrategyResult(
+                        p50=sorted_by_silver[p50_idx],
+                        p90=sorted_by_silver[p90_idx],
+                        worst=sorted_by_silver[-1],
+                        label=rest_label,
+                        progress=100,
+                    )
 
-                # Redraw table after completing each strategy
-                await self._redraw_table(log, results, restoration_options)
-                await asyncio.sleep(0)
+                    # Redraw table after completing each strategy
+                    self._schedule_redraw(log, results, restoration_options)
+                    await asyncio.sleep(0)
+            finally:
+                # Drop this run's queued jobs; in-flight ones finish on their own
+                for jobs in strategy_jobs:
+                    for job in jobs:
+                        job.cancel()
 
-            # Final redraw with best highlighted
+            # Final redraw with best highlighted, drawn right away over any queued one
             if results and self.running:
+                self._cancel_pending_redraw()
                 await self._redraw_table(log, results, restoration_options, final=True)
 
             status.update("Status: Complete!")
@@ -1848,75 +2112,6 @@ class RestorationStrategyScreen(Screen):
         finally:
             self.running = False
 
-    async def _redraw_table(self, log: RichLog, results: dict, restoration_options: list, final: bool = False) -> None:
-        """Redraw the results table."""
-        log.clear()
-        log.write("[bold]Monte Carlo Restoration Strategy Analysis[/bold]")
-        log.write(f"Start: +{ROMAN_NUMERALS[self.config.start_level]} → Target: +{ROMAN_NUMERALS[self.config.target_level]}, Simulations: {self.num_simulations}\n")
-
-        # Header
-        log.write(f"{'Rest.From':<10} {'Prog.':>6} {'Crystals':>10} {'Scrolls':>10} {'Silver':>12}")
-        log.write("-" * 52)
-
-        # Find best strategy if final
-        best_strategy = None
-        if final and results:
-            best_strategy = min(results.keys(), key=lambda k: results[k]["p50"][2])  # Sort by silver
-
-        # Sort by p50 silver if final, otherwise keep original order
-        if final:
-            display_order = sorted(results.keys(), key=lambda k: results[k]["p50"][2])
-        else:
-            display_order = restoration_options
-
-        for rest_from in display_order:
-            rest_label = f"+{ROMAN_NUMERALS[rest_from]}"
-
-            if rest_from in results:
-                r = results[rest_from]
-                progress = f"{r['progress']}%"
-
-                # P50 row
-                p50_crystals, p50_scrolls, p50_silver = r["p50"]
-                if final and rest_from == best_strategy:
-                    log.write(f"[green bold]{rest_label:<10} {progress:>6} {p50_crystals:>10} {p50_scrolls:>10} {self._format_silver(p50_silver):>12} ★ P50[/green bold]")
-                else:
-                    log.write(f"{rest_label:<10} {progress:>6} {p50_crystals:>10} {p50_scrolls:>10} {self._format_silver(p50_silver):>12}    P50")
-
-                # P90 row
-                p90_crystals, p90_scrolls, p90_silver = r["p90"]
-                log.write(f"{'':10} {'':>6} {p90_crystals:>10} {p90_scrolls:>10} {self._format_silver(p90_silver):>12}    P90")
-
-                # Worst row
-                worst_crystals, worst_scrolls, worst_silver = r["worst"]
-                log.write(f"{'':10} {'':>6} {worst_crystals:>10} {worst_scrolls:>10} {self._format_silver(worst_silver):>12}    Worst")
-                log.write("")
-            else:
-                log.write(f"{rest_label:<10} {'wait':>6} {'-':>10} {'-':>10} {'-':>12}")
-
-        log.write("-" * 52)
-
-        if final and best_strategy is not None:
-            best_label = results[best_strategy]["label"]
-            best_p50_silver = self._format_silver(results[best_strategy]["p50"][2])
-            log.write(f"\n[bold green]★ Recommended: {best_label} (P50 Silver: {best_p50_silver})[/bold green]")
-
-    def _format_silver(self, silver: int) -> str:
-        """Format silver amount with K/M/B/T suffix."""
-        return format_silver(silver)
-
-    async def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "back-button":
-            await self.action_back()
-
-    async def action_back(self) -> None:
-        await self._cancel_task()
-        self.app.pop_screen()
-
-    async def action_quit(self) -> None:
-        await self._cancel_task()
-        self.app.exit()
-
 
 class BDMEnhancementApp(App):
     """Main TUI application."""
@@ -1944,10 +2139,24 @@ class BDMEnhancementApp(App):
             "valks_50": 0,
             "valks_100": 0,
         }
+        # Strategy analysis worker processes, started on first use and kept for the session
+        self._analysis_pool: ProcessPoolExecutor | None = None
+
+    @property
+    def analysis_pool(self) -> ProcessPoolExecutor:
+        """Worker process pool shared by all strategy analysis runs."""
+        if self._analysis_pool is None:
+            self._analysis_pool = _analysis_pool()
+        return self._analysis_pool
 
     def on_mount(self) -> None:
         self.push_screen(ModuleSelectScreen())
 
+    def on_unmount(self) -> None:
+        """Stop the analysis workers when the app shuts down."""
+        if self._analysis_pool is not None:
+            self._analysis_pool.shutdown(wait=False, cancel_futures=True)
+
     def on_click(self, event: Click) -> None:
         """Handle right-click to copy selected text to clipboard."""
         if event.button == 3:  # Right mouse button
@@ -1957,8 +2166,20 @@ class BDMEnhancementApp(App):
                 self.notify("Copied to clipboard", timeout=1)
 
 
+def _install_fast_event_loop() -> None:
+    """Run the app on uvloop when the optional `fast` extra is installed."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
     """Entry point for the TUI."""
+    _install_fast_event_loop()
     app = BDMEnhancementApp()
     app.run()
 
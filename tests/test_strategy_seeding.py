@@ -0,0 +1,36 @@
+"""A seeded strategy analysis must not depend on the worker pool it runs on."""
+import asyncio
+import random
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+from src.item_types.awakening.engine import SimulationConfig
+from src.tui import _SPAWN_CONTEXT, _submit_strategy_jobs
+
+NUM_SIMS = 60  # Two full jobs and a partial one
+
+
+async def _strategy_table(workers: int, seed: int) -> list[tuple]:
+    """P50/P90/worst rows per restoration level, gathered as the strategy screens do."""
+    job_seeds = random.Random(seed)
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_SPAWN_CONTEXT) as pool:
+        strategy_jobs = [
+            _submit_strategy_jobs(
+                loop, pool, SimulationConfig(target_level=7, restoration_from=rest_from),
+                NUM_SIMS, job_seeds.getrandbits(64),
+            )
+            for rest_from in (4, 5, 6)
+        ]
+        table = []
+        for jobs in strategy_jobs:
+            results = []
+            for job in jobs:
+                results.extend(await job)
+            results.sort(key=itemgetter(2))
+            table.append((results[len(results) // 2], results[int(len(results) * 0.9)], results[-1]))
+    return table
+
+
+def test_seeded_table_is_the_same_for_any_worker_count():
+    assert asyncio.run(_strategy_table(1, 42)) == asyncio.run(_strategy_table(3, 42))